@@ -7,6 +7,7 @@ Supports both brand names (e.g., 'ford') and domain names (e.g., 'ford.com').
 YAML configuration files with fallback to base defaults.
 """
 
+import copy
 import os
 import re
 import yaml
@@ -35,6 +36,9 @@ class ConfigManager:
         self._base_config: Optional[Dict[str, Any]] = None
         self._site_configs: Dict[str, Dict[str, Any]] = {}  # Renamed from _manufacturer_configs
         self._llm_configs: Dict[str, Dict[str, Any]] = {}  # Memory cache for LLM configs
+        self._merged_configs: Dict[str, Dict[str, Any]] = {}  # Memory cache for get_config()
+        # Hours a failed site analysis is remembered (0 = don't skip analysis)
+        self.analysis_failure_ttl_hours = float(os.getenv('ANALYSIS_FAILURE_TTL_HOURS', '24'))
 
     @staticmethod
     def _normalize_key(key: str) -> str:
@@ -107,11 +111,16 @@ class ConfigManager:
         # Normalize the key
         normalized_key = self._normalize_key(site_key)
 
+        # Return a copy of the memoized merge (callers mutate their config)
+        if normalized_key in self._merged_configs:
+            return copy.deepcopy(self._merged_configs[normalized_key])
+
         # Load base config
         config = self._get_base_config()
 
         # If empty key, just return base config
         if not normalized_key:
+            self._merged_configs[normalized_key] = copy.deepcopy(config)
             return config
 
         # Load LLM-generated config (from domain-based cache)
@@ -144,6 +153,7 @@ class ConfigManager:
         # Merge configurations (manual config overrides LLM, which overrides base)
         config = self._deep_merge(config, site_config)
 
+        self._merged_configs[normalized_key] = copy.deepcopy(config)
         return config
 
     def _load_llm_generated_config(self, site_key: str) -> Optional[Dict[str, Any]]:
@@ -200,6 +210,7 @@ class ConfigManager:
 
         # Store in memory cache
         self._llm_configs[normalized] = config
+        self._merged_configs.pop(normalized, None)
 
         # Save to file cache
         file_path = save_dynamic_config(config, normalized, self.llm_cache_dir)
@@ -215,15 +226,8 @@ class ConfigManager:
         Returns:
             True if LLM config exists
         """
-        normalized = self._normalize_key(site_key)
-
-        # Check memory cache
-        if normalized in self._llm_configs:
-            return True
-
-        # Check file cache
-        config = load_dynamic_config(normalized, self.llm_cache_dir)
-        return config is not None
+        # Loads through the memory cache so a later get_config() doesn't re-read the file
+        return self._load_llm_generated_config(site_key) is not None
 
     def _deep_merge(self, base: Dict, override: Dict) -> Dict:
         """Deep merge two dictionaries."""
@@ -355,6 +359,70 @@ class ConfigManager:
         except Exception as e:
             print(f"Error caching discovery result for {domain}: {e}")
 
+    # Failed analysis cache methods
+    def get_analysis_failure_path(self, domain: str) -> Path:
+        """
+        Get cache file path for a site's last failed LLM analysis.
+
+        Args:
+            domain: Domain name (e.g., 'ford.com')
+
+        Returns:
+            Path to analysis failure file
+        """
+        cache_dir = Path("data/analysis_failures")
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        normalized = self._normalize_key(domain)
+        return cache_dir / f"{normalized}.json"
+
+    def get_recent_analysis_failure(self, domain: str, ttl_hours: Optional[float] = None) -> Optional[Dict]:
+        """
+        Load the site's last analysis failure if it happened within ttl_hours.
+
+        Args:
+            domain: Domain name
+            ttl_hours: How long a failure is remembered (default:
+                ANALYSIS_FAILURE_TTL_HOURS env var, else 24)
+
+        Returns:
+            Failure record ({'reason', 'failed_at'}) or None
+        """
+        if ttl_hours is None:
+            ttl_hours = self.analysis_failure_ttl_hours
+        if ttl_hours <= 0:
+            return None
+
+        cache_path = self.get_analysis_failure_path(domain)
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+            failed_at = datetime.fromisoformat(data['failed_at'])
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            print(f"Error loading analysis failure for {domain}: {e}")
+            return None
+
+        if (datetime.now() - failed_at).total_seconds() < ttl_hours * 3600:
+            return data
+        return None
+
+    def cache_analysis_failure(self, domain: str, reason: str):
+        """
+        Remember that analyzing a site failed, so runs soon after skip it.
+
+        Args:
+            domain: Domain name
+            reason: Short description of the failure
+        """
+        cache_path = self.get_analysis_failure_path(domain)
+        try:
+            with open(cache_path, 'w') as f:
+                json.dump({'reason': reason, 'failed_at': datetime.now().isoformat()}, f, indent=2)
+        except Exception as e:
+            print(f"Error caching analysis failure for {domain}: {e}")
+
 
 # Global config manager instance
 _config_manager: Optional[ConfigManager] = None
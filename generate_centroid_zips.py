@@ -18,14 +18,18 @@ Usage:
 
 import argparse
 import math
+import sys
 from typing import List
 from dataclasses import dataclass
 
 import pgeocode
 import pandas as pd
 
+# slots=True needs Python 3.10+; older interpreters keep a plain dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ZipInfo:
     """Represents a zip code with its coordinates."""
     zipcode: str
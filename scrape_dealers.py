@@ -20,19 +20,21 @@ Website list format (websites.txt):
 import argparse
 import asyncio
 import csv
+import gzip
 import json
 import os
 import re
+import shutil
+import sys
 import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 
-from bs4 import BeautifulSoup
-
 from config_manager import get_config_manager
 from utils.dynamic_config import generate_config_from_analysis
 from utils.extraction import (
@@ -44,12 +46,21 @@ from utils.extraction import (
 )
 from utils.jina_reader import JinaReader
 from utils.llm_analyzer import LLMAnalyzer
-from utils.crawl4ai_scraper import Crawl4AIScraper
-from utils.post_search_validator import PostSearchValidator
-from utils.firecrawl_discovery import DealerLocatorDiscovery
 
+_DISCOVERED_SELECTORS_RE = re.compile(r'<!-- DISCOVERED_SELECTORS: (.+?) -->')
+_DISCOVERED_SELECTORS_LINE_RE = re.compile(r'<!-- DISCOVERED_SELECTORS: .+? -->\n')
+
+try:
+    import orjson  # Optional: faster JSON encoding for output files
+except ImportError:
+    orjson = None
+
+
+# slots=True needs Python 3.10+; older interpreters keep a plain dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class Dealer:
     """Represents a car dealership."""
     source_url: str
@@ -66,6 +77,96 @@ class Dealer:
     scrape_date: str = ""
 
 
+_DEALER_FIELDS = tuple(field.name for field in fields(Dealer))
+_dealer_values = attrgetter(*_DEALER_FIELDS)
+# '"field": ' prefixes for encoding compact JSON records straight from a row
+_JSON_KEY_PREFIXES = tuple(json.dumps(name) + ': ' for name in _DEALER_FIELDS)
+_encode_json_str = json.encoder.encode_basestring
+
+
+def _dealer_key(dealer: Dealer) -> Tuple[str, str]:
+    """Case-insensitive (name, address) identity of a dealer for output deduplication."""
+    return (dealer.name.casefold(), dealer.address.casefold())
+
+
+def _row_json(row: Tuple[str, ...], pretty: bool = False) -> bytes:
+    """
+    Serialize one Dealer field-value row as a UTF-8 JSON object.
+
+    orjson (when installed) already produces UTF-8 bytes, which go straight
+    to the binary output file without a decode/re-encode round trip.
+    """
+    if orjson is not None:
+        record = dict(zip(_DEALER_FIELDS, row))
+        return orjson.dumps(record, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if not pretty:
+        # Same output as json.dumps(..., ensure_ascii=False) without building a dict
+        try:
+            text = '{' + ', '.join(map(str.__add__, _JSON_KEY_PREFIXES, map(_encode_json_str, row))) + '}'
+            return text.encode('utf-8')
+        except TypeError:
+            pass  # A non-str field value; let json.dumps handle it
+    text = json.dumps(dict(zip(_DEALER_FIELDS, row)), ensure_ascii=False, indent=2 if pretty else None)
+    return text.encode('utf-8')
+
+
+# Lowercased JSON keys that carry dealer fields in captured locator responses
+_JSON_NAME_KEYS = ('name', 'dealername', 'dealer_name', 'displayname', 'locationname', 'title')
+_JSON_ADDRESS_KEYS = ('address', 'address1', 'addressline1', 'address_line_1', 'street', 'streetaddress', 'street1')
+_JSON_CITY_KEYS = ('city', 'locality', 'town')
+_JSON_STATE_KEYS = ('state', 'statecode', 'state_code', 'region', 'province')
+_JSON_ZIP_KEYS = ('zip', 'zipcode', 'zip_code', 'postalcode', 'postal_code', 'postcode')
+_JSON_PHONE_KEYS = ('phone', 'phonenumber', 'phone_number', 'telephone', 'salesphone', 'mainphone')
+_JSON_WEBSITE_KEYS = ('website', 'websiteurl', 'website_url', 'url', 'homepage', 'dealerurl')
+_JSON_DISTANCE_KEYS = ('distance', 'distancemiles', 'distance_miles', 'miles')
+
+
+def _flatten_json_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Lowercase a record's keys and lift keys of nested objects (e.g. address) one level."""
+    flat = {key.lower(): value for key, value in record.items()}
+    for value in record.values():
+        if isinstance(value, dict):
+            for key, nested in value.items():
+                flat.setdefault(key.lower(), nested)
+    return flat
+
+
+def _json_value(flat: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    """Return the first non-empty scalar value stored under one of keys."""
+    for key in keys:
+        value = flat.get(key)
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            value = str(value).strip()
+            if value:
+                return value
+    return ""
+
+
+def _looks_like_dealer_record(record: Dict[str, Any]) -> bool:
+    """Check whether a JSON object has a name plus an address, zip or phone."""
+    flat = _flatten_json_record(record)
+    return bool(_json_value(flat, _JSON_NAME_KEYS)) and bool(
+        _json_value(flat, _JSON_ADDRESS_KEYS)
+        or _json_value(flat, _JSON_ZIP_KEYS)
+        or _json_value(flat, _JSON_PHONE_KEYS)
+    )
+
+
+def _json_record_lists(data: Any):
+    """Yield every list of dealer-like objects found anywhere in a JSON document."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(value for value in node.values() if isinstance(value, (dict, list)))
+        elif isinstance(node, list):
+            records = [item for item in node if isinstance(item, dict)]
+            if records and _looks_like_dealer_record(records[0]):
+                yield records
+            else:
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
+
+
 class GenericDealerScraper:
     """
     Generic scraper that works with any dealer locator website.
@@ -83,12 +184,16 @@ class GenericDealerScraper:
         "today's sales hours", 'sales & services hours',
         'view dealer inventory', 'get directions', 'miles away'
     ]
+    SKIP_NAMES_LOWER = tuple(s.lower() for s in SKIP_NAMES)
+    # One alternation scanned in C instead of a substring test per skip name
+    _SKIP_RE = re.compile('|'.join(map(re.escape, SKIP_NAMES_LOWER)), re.IGNORECASE)
 
     def __init__(
         self,
         url: str,
         headless: bool = True,
-        enable_ai: bool = True
+        enable_ai: bool = True,
+        concurrent_searches: Optional[int] = None
     ):
         """
         Initialize the generic scraper.
@@ -97,26 +202,38 @@ class GenericDealerScraper:
             url: Dealer locator URL to scrape
             headless: Run browser in headless mode
             enable_ai: Enable AI features (Jina Reader and LLM analysis)
+            concurrent_searches: Zip searches to run at once in the shared
+                browser (overrides interactions.concurrent_searches)
         """
         self.url = url
         self.domain = self._extract_domain(url)
         self.headless = headless
         self.enable_ai = enable_ai
+        self.concurrent_searches = concurrent_searches
         self.debug = os.getenv("SCRAPER_DEBUG", "false").lower() == "true"
         self.scrape_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.seen_dealers = set()
+        self.seen_card_texts = set()
 
         # Initialize AI components
         self.jina_reader = JinaReader(enabled=enable_ai)
         self.llm_analyzer = LLMAnalyzer(enabled=enable_ai)
 
-        # Initialize Crawl4AI components
+        # Initialize Crawl4AI components (imported here so --help and
+        # --list-websites don't pay for loading crawl4ai/Playwright)
+        from utils.crawl4ai_scraper import Crawl4AIScraper
+        from utils.post_search_validator import PostSearchValidator
+        from utils.firecrawl_discovery import DealerLocatorDiscovery
+
         self.crawl4ai = Crawl4AIScraper(headless=headless, verbose=self.debug)
-        self.post_validator = PostSearchValidator()
-        self.discovery = DealerLocatorDiscovery()
+        self.post_validator = PostSearchValidator(debug=self.debug)
+        # Discovery crawls in the same browser the searches use
+        self.discovery = DealerLocatorDiscovery(crawler_factory=self.crawl4ai.get_crawler)
 
         # Configuration (loaded after analysis)
         self.config_manager = get_config_manager()
+        # Selectors that matched on earlier pages this run, tried first
+        self._winning_selectors: Dict[str, str] = {}
         self.config: Dict[str, Any] = {}
         self.selectors: Dict[str, Any] = {}
         self.data_fields: Dict[str, Any] = {}
@@ -125,6 +242,12 @@ class GenericDealerScraper:
         # Post-search validation flag (validates once per domain)
         self.validated = False
 
+        # Optional same-day cache of per-zip results (for iterative re-runs)
+        self.zip_cache = None
+        if os.getenv("ZIP_RESULT_CACHE", "false").lower() == "true":
+            from utils.zip_result_cache import ZipResultCache
+            self.zip_cache = ZipResultCache(schema=",".join(_DEALER_FIELDS))
+
     @staticmethod
     def _extract_domain(url: str) -> str:
         """Extract clean domain from URL."""
@@ -190,6 +313,19 @@ class GenericDealerScraper:
 
             return True
 
+        # Discovery, content fetch and LLM calls take many seconds, so a site
+        # that just failed analysis goes straight to the default selectors
+        # (RETRY_FAILED_ANALYSIS=true analyzes it again regardless)
+        initial_domain = self.domain
+        failure = None
+        if os.getenv("RETRY_FAILED_ANALYSIS", "false").lower() != "true":
+            failure = self.config_manager.get_recent_analysis_failure(initial_domain)
+        if failure:
+            print(f"  Analysis of {initial_domain} failed recently ({failure.get('reason')}), "
+                  f"using default selectors")
+            self._load_default_config()
+            return False
+
         print(f"  Discovering dealer locator URL for {self.url}...")
 
         # Step 1: Crawl4AI-based URL discovery
@@ -214,10 +350,12 @@ class GenericDealerScraper:
         else:
             print("  Discovery did not find a different URL, analyzing current page...")
 
-        # Step 2: Fetch content for LLM analysis
+        # Step 2: Fetch content for LLM analysis (blocking HTTP with retries,
+        # so run it off the event loop)
         print(f"  Analyzing {self.url} with LLM...")
-        artifacts = self.jina_reader.save_analysis_artifacts(self.url)
+        artifacts = await asyncio.to_thread(self.jina_reader.save_analysis_artifacts, self.url)
         if not artifacts or not artifacts.get('content'):
+            # Not remembered: a fetch failure is usually transient
             print(f"  Warning: Could not fetch content, using default selectors")
             self._load_default_config()
             return False
@@ -226,20 +364,27 @@ class GenericDealerScraper:
         if self._is_jina_404_content(artifacts.get('content', '')):
             print(f"  Warning: Page returned 404 content, using default selectors")
             self._load_default_config()
+            self.config_manager.cache_analysis_failure(initial_domain, 'page returned 404 content')
             return False
 
-        # Step 3: Analyze page structure with LLM (now includes Crawl4AI templates)
-        discovery_result = self.llm_analyzer.find_dealer_locator_url(
-            artifacts['content'],
-            self.url
-        )
-
+        # Step 3: Find locator URL with LLM (now includes Crawl4AI templates)
         # Step 4: Analyze page structure with LLM (generates Crawl4AI config)
-        analysis_result = self.llm_analyzer.analyze_page_structure(
-            artifacts['content'],
-            self.url
+        # Both only read the fetched content, so the two requests run together
+        discovery_result, analysis_result = await asyncio.gather(
+            asyncio.to_thread(
+                self.llm_analyzer.find_dealer_locator_url,
+                artifacts['content'],
+                self.url
+            ),
+            asyncio.to_thread(
+                self.llm_analyzer.analyze_page_structure,
+                artifacts['content'],
+                self.url
+            ),
         )
         if not analysis_result:
+            # Not remembered either: None also covers an unreachable LLM
+            # endpoint, which says nothing about the site
             print(f"  Warning: LLM analysis failed, using default selectors")
             self._load_default_config()
             return False
@@ -357,41 +502,125 @@ class GenericDealerScraper:
             List of Dealer objects
         """
         all_dealers = []
+        async for dealers in self.scrape_iter(zip_codes):
+            all_dealers.extend(dealers)
+        return all_dealers
+
+    async def scrape_iter(self, zip_codes: List[str]) -> AsyncIterator[List[Dealer]]:
+        """
+        Scrape dealers zip code by zip code, yielding each batch as it completes.
+
+        Zip codes are searched one at a time until one has passed post-search
+        validation (which may refine the selectors); the remaining zip codes are
+        then pulled from a shared queue by up to
+        interactions.concurrent_searches searches at once.
+
+        Args:
+            zip_codes: List of zip codes to search
 
+        Yields:
+            List of new Dealer objects found for one zip code
+        """
         # First, analyze the site (includes discovery + config generation)
         await self.analyze_site()
 
-        # Scrape each zip code (Crawl4AI handles browser automation internally)
-        consecutive_errors = 0
-        max_consecutive_errors = 5
-
-        for i, zip_code in enumerate(zip_codes):
-            print(f"[{i+1}/{len(zip_codes)}] Scraping {self.domain} for {zip_code}...")
+        if not zip_codes:
+            return
 
-            try:
-                dealers = await self._scrape_zip(zip_code)
-                all_dealers.extend(dealers)
-                print(f"  Found {len(dealers)} dealers")
-                consecutive_errors = 0  # Reset on success
+        # Scrape each zip code (Crawl4AI keeps one browser open across searches)
+        self._search_backoff = 0.0
+        workers = []
+        try:
+            # Search sequentially until validation has run, so concurrent
+            # searches never race on refining the shared config
+            next_index = 0
+            while next_index < len(zip_codes) and not self.validated:
+                yield await self._scrape_zip_with_delay(next_index, zip_codes)
+                next_index += 1
+
+            concurrency = self.concurrent_searches or self.interactions.get('concurrent_searches', 1)
+            concurrency = max(1, int(concurrency))
+
+            # Searches pull the next zip code from a shared queue as they
+            # free up, so a few slow zip codes don't hold back the rest
+            pending: asyncio.Queue = asyncio.Queue()
+            for index in range(next_index, len(zip_codes)):
+                pending.put_nowait(index)
+            results: asyncio.Queue = asyncio.Queue()
+
+            async def search_worker():
+                while True:
+                    try:
+                        index = pending.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    try:
+                        dealers = await self._scrape_zip_with_delay(index, zip_codes)
+                    except Exception as e:
+                        print(f"  Search worker error for {zip_codes[index]}: {e}")
+                        dealers = []
+                    results.put_nowait(dealers)
+
+            workers = [
+                asyncio.ensure_future(search_worker())
+                for _ in range(min(concurrency, pending.qsize()))
+            ]
+            for _ in range(len(zip_codes) - next_index):
+                yield await results.get()
+        finally:
+            # Let cancelled searches unwind before the browser goes away
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self.close()
+
+    async def close(self):
+        """Close the shared browser and the zip result cache."""
+        await self.crawl4ai.close()
+        if self.zip_cache is not None:
+            self.zip_cache.close()
+            self.zip_cache = None
+
+    async def _scrape_zip_with_delay(self, index: int, zip_codes: List[str]) -> List[Dealer]:
+        """
+        Scrape one zip code, backing off before the next search if it failed.
 
-            except Exception as e:
-                error_msg = str(e)
-                print(f"  Error scraping {zip_code}: {error_msg}")
-                consecutive_errors += 1
+        Args:
+            index: Position of the zip code in zip_codes
+            zip_codes: Full list of zip codes being scraped
 
-                # If too many consecutive errors, take a longer break
-                if consecutive_errors >= max_consecutive_errors:
-                    print(f"  Too many consecutive errors ({consecutive_errors}), taking a 30s break...")
-                    await asyncio.sleep(30)
-                    consecutive_errors = 0
+        Returns:
+            List of Dealer objects (empty on error)
+        """
+        zip_code = zip_codes[index]
+        print(f"[{index+1}/{len(zip_codes)}] Scraping {self.domain} for {zip_code}...")
 
-                continue
+        try:
+            dealers = await self._scrape_zip(zip_code)
+            print(f"  Found {len(dealers)} dealers")
+            # Ease off the backoff as searches succeed again
+            self._search_backoff /= 2
 
-            # Delay between requests to avoid rate limiting
-            delay = self.interactions.get('wait_after_search', 2)
-            await asyncio.sleep(max(delay, 2))
+        except Exception as e:
+            error_msg = str(e)
+            print(f"  Error scraping {zip_code}: {error_msg}")
+
+            # Back off only when the site starts failing (1s, 3s, 7s, ... up to 30s)
+            self._search_backoff = min(self._search_backoff * 2 + 1, 30)
+            print(f"  Backing off {self._search_backoff:.0f}s before the next search...")
+            await asyncio.sleep(self._search_backoff)
+            return []
+
+        # Politeness delay between searches; without an explicit setting it
+        # stays the site's wait_after_search (at least 2s), as before
+        delay = self.interactions.get(
+            'delay_between_searches',
+            max(self.interactions.get('wait_after_search', 2), 2)
+        )
+        if delay:
+            await asyncio.sleep(delay)
 
-        return all_dealers
+        return dealers
 
     async def _scrape_zip(self, zip_code: str) -> List[Dealer]:
         """
@@ -411,6 +640,12 @@ class GenericDealerScraper:
         """
         dealers = []
 
+        if self.zip_cache is not None:
+            rows = self.zip_cache.get(self.url, zip_code)
+            if rows is not None:
+                print(f"  Using today's cached results for {zip_code} ({len(rows)} dealers)")
+                return self._take_new_dealers([Dealer(*row) for row in rows])
+
         try:
             # Step 1: Execute search with Crawl4AI
             if self.debug:
@@ -424,17 +659,14 @@ class GenericDealerScraper:
             )
 
             if not html:
-                print(f"  Error: Crawl4AI returned no HTML for {zip_code}")
-                return dealers
+                raise RuntimeError("Crawl4AI returned no HTML")
 
             if self.debug:
                 print(f"  Crawl4AI: Received {len(html)} chars of HTML")
 
             # Check if LLM discovered new data field selectors
             if html.startswith('<!-- DISCOVERED_SELECTORS:'):
-                import re
-                import json
-                match = re.search(r'<!-- DISCOVERED_SELECTORS: (.+?) -->', html)
+                match = _DISCOVERED_SELECTORS_RE.search(html)
                 if match:
                     discovered_selectors = json.loads(match.group(1))
                     if discovered_selectors.get('data_fields'):
@@ -447,7 +679,7 @@ class GenericDealerScraper:
                                 if isinstance(cfg, dict):
                                     print(f"    - {field}: {cfg.get('selector', 'N/A')}")
                     # Remove the comment from HTML
-                    html = re.sub(r'<!-- DISCOVERED_SELECTORS: .+? -->\n', '', html)
+                    html = _DISCOVERED_SELECTORS_LINE_RE.sub('', html)
 
             # Step 2: Post-search validation (runs once per domain)
             # Skip validation if explicitly disabled (e.g., for manual configs)
@@ -482,6 +714,7 @@ class GenericDealerScraper:
                     # Reload config sections after refinement
                     self.selectors = self.config.get('selectors', {})
                     self.data_fields = self.config.get('data_fields', {})
+                    self._winning_selectors.clear()
 
                     print(f"  Refined selectors: {self.selectors.get('dealer_cards', [])}")
 
@@ -491,55 +724,97 @@ class GenericDealerScraper:
                 self.validated = True
 
             # Step 3: Extract dealers from HTML
-            dealers = self._extract_dealers_from_html(html, zip_code)
+            if self.zip_cache is not None:
+                # Cache everything the zip returned, so a later run over a
+                # different zip set isn't missing dealers this run had
+                # already seen elsewhere
+                found = self._extract_dealers_from_html(html, zip_code, dedupe=False)
+                self.zip_cache.put(self.url, zip_code, [_dealer_values(d) for d in found])
+                dealers = self._take_new_dealers(found)
+            else:
+                dealers = self._extract_dealers_from_html(html, zip_code)
 
             if self.debug:
                 print(f"  Extracted {len(dealers)} dealers from HTML")
 
             return dealers
 
-        except Exception as e:
-            print(f"  Error in _scrape_zip for {zip_code}: {e}")
+        except Exception:
             if self.debug:
                 import traceback
                 traceback.print_exc()
-            return dealers
+            # Let _scrape_zip_with_delay count the failure and back off
+            raise
+
+    def _take_new_dealers(self, dealers: List[Dealer]) -> List[Dealer]:
+        """
+        Keep only dealers not seen earlier in this run, marking them seen.
+
+        Args:
+            dealers: Dealers found for one zip code
 
-    def _extract_dealers_from_html(self, html: str, zip_code: str) -> List[Dealer]:
+        Returns:
+            The new dealers
+        """
+        new_dealers = []
+        for dealer in dealers:
+            dealer_key = (dealer.name.casefold(), dealer.zip_code.casefold())
+            if dealer_key not in self.seen_dealers:
+                self.seen_dealers.add(dealer_key)
+                new_dealers.append(dealer)
+        return new_dealers
+
+    def _extract_dealers_from_html(self, html: str, zip_code: str, dedupe: bool = True) -> List[Dealer]:
         """
         Extract dealers from HTML using BeautifulSoup.
 
         Args:
             html: HTML string from Crawl4AI
             zip_code: Search zip code
+            dedupe: Skip cards and dealers already seen this run (otherwise
+                return every valid dealer on the page)
 
         Returns:
             List of Dealer objects
         """
+        from bs4 import BeautifulSoup
+
         dealers = []
-        soup = BeautifulSoup(html, 'html.parser')
+        # lxml's C parser builds the tree several times faster than the
+        # pure-Python html.parser on full locator pages
+        soup = BeautifulSoup(html, 'lxml')
 
         # Get dealer card selectors
         card_selectors = self.selectors.get('dealer_cards', [])
-        if not card_selectors:
+        use_xhr = self.interactions.get('use_xhr_results', False)
+        if not card_selectors and not use_xhr:
             print("  Warning: No dealer card selectors configured")
             return dealers
 
-        # Find dealer cards
+        # Find dealer cards, trying the selector that matched last time first
         cards = []
-        for selector in card_selectors:
+        for selector in self._winner_first('dealer_cards', card_selectors):
             try:
                 found_cards = soup.select(selector)
                 if found_cards:
                     cards = found_cards
                     if self.debug:
                         print(f"  Found {len(cards)} cards with selector: {selector}")
+                    self._record_winner('dealer_cards', selector)
                     break
             except Exception as e:
                 if self.debug:
                     print(f"  Selector error ({selector}): {e}")
                 continue
 
+        # Sites that opt in may use the captured search responses instead,
+        # as long as they agree with the cards on the page
+        if use_xhr:
+            xhr_dealers = self._extract_dealers_from_xhr(soup, zip_code, len(cards), dedupe)
+            if xhr_dealers is not None:
+                print(f"  Extracted {len(xhr_dealers)} dealers from captured search responses")
+                return xhr_dealers
+
         if not cards:
             print(f"  No dealer cards found in HTML")
             return dealers
@@ -548,11 +823,24 @@ class GenericDealerScraper:
 
         # Extract each dealer
         for i, card in enumerate(cards):
+            # Overlapping searches return the same cards again; identical card
+            # text always yields the same name|zip key, so skip parsing it
+            if dedupe:
+                card_text = card.get_text()
+                if card_text in self.seen_card_texts:
+                    continue
+
             try:
                 dealer = self._parse_dealer_card(card, zip_code)
                 if dealer and self._is_valid_dealer(dealer):
+                    if not dedupe:
+                        dealers.append(dealer)
+                        continue
+                    # Only cards that produced a dealer are skipped later, so
+                    # a card that failed to parse is tried again next time
+                    self.seen_card_texts.add(card_text)
                     # Deduplication
-                    dealer_key = f"{dealer.name}|{dealer.zip_code}".lower()
+                    dealer_key = (dealer.name.casefold(), dealer.zip_code.casefold())
                     if dealer_key not in self.seen_dealers:
                         self.seen_dealers.add(dealer_key)
                         dealers.append(dealer)
@@ -565,6 +853,75 @@ class GenericDealerScraper:
 
         return dealers
 
+    def _extract_dealers_from_xhr(self, soup, zip_code: str, card_count: int = 0,
+                                  dedupe: bool = True) -> Optional[List[Dealer]]:
+        """
+        Build dealers from the JSON search responses captured by Crawl4AIScraper.
+
+        The largest list of dealer-like objects across all captured payloads
+        is taken as the result set. It is only used when no dealer cards
+        matched or it holds exactly as many records as there are cards.
+
+        Args:
+            soup: BeautifulSoup of the search results page
+            zip_code: Search zip code
+            card_count: Number of dealer cards matched on the page
+            dedupe: Return only dealers not seen earlier in this run
+
+        Returns:
+            New (not yet seen) dealers, or None when the page holds no
+            usable captured response and cards must be scraped instead
+        """
+        node = soup.find('script', id='__dealer_xhr')
+        if node is None or not node.string:
+            return None
+        try:
+            payloads = json.loads(node.string)
+        except ValueError:
+            return None
+
+        records = []
+        for payload in payloads:
+            try:
+                data = orjson.loads(payload) if orjson is not None else json.loads(payload)
+            except (TypeError, ValueError):
+                continue
+            for candidate in _json_record_lists(data):
+                if len(candidate) > len(records):
+                    records = candidate
+        if not records:
+            return None
+        if card_count and len(records) != card_count:
+            if self.debug:
+                print(f"  Captured responses hold {len(records)} records but page has {card_count} cards, using cards")
+            return None
+
+        dealers = []
+        for record in records:
+            flat = _flatten_json_record(record)
+            name = clean_name(_json_value(flat, _JSON_NAME_KEYS))
+            if not name:
+                continue
+            phone = _json_value(flat, _JSON_PHONE_KEYS)
+            dealer = Dealer(
+                source_url=self.url,
+                name=name,
+                address=_json_value(flat, _JSON_ADDRESS_KEYS),
+                city=_json_value(flat, _JSON_CITY_KEYS),
+                state=_json_value(flat, _JSON_STATE_KEYS),
+                zip_code=_json_value(flat, _JSON_ZIP_KEYS),
+                phone=extract_phone(phone) or phone,
+                website=_json_value(flat, _JSON_WEBSITE_KEYS),
+                distance_miles=_json_value(flat, _JSON_DISTANCE_KEYS),
+                search_zip=zip_code,
+                scrape_date=self.scrape_date
+            )
+            if not self._is_valid_dealer(dealer):
+                continue
+            dealers.append(dealer)
+
+        return self._take_new_dealers(dealers) if dedupe else dealers
+
     def _parse_dealer_card(self, card, zip_code: str) -> Optional[Dealer]:
         """
         Parse a single dealer card element to extract dealer information.
@@ -589,17 +946,18 @@ class GenericDealerScraper:
         address_raw = self._extract_field(card, self.data_fields.get('address', {}))
         address_parts = parse_address(address_raw) if address_raw else {}
 
+        card_text = card.get_text()
+
         # Extract phone
         phone_raw = self._extract_field(card, self.data_fields.get('phone', {}))
-        phone = extract_phone(phone_raw, card.get_text()) if phone_raw else ""
+        phone = extract_phone(phone_raw, card_text) if phone_raw else ""
 
         # Extract website
         website_raw = self._extract_field(card, self.data_fields.get('website', {}))
         website = extract_website_url(website_raw, self.domain) if website_raw else ""
 
         # Extract distance (optional)
-        distance_text = card.get_text()
-        distance = extract_distance(distance_text)
+        distance = extract_distance(card_text)
 
         # Extract dealer type (optional, e.g., "Elite", "Certified")
         dealer_type = self._extract_field(card, self.data_fields.get('dealer_type', {})) or "Standard"
@@ -684,15 +1042,35 @@ class GenericDealerScraper:
             return False
 
         # Check against skip names
-        name_lower = dealer.name.lower()
-        for skip_name in self.SKIP_NAMES:
-            if skip_name in name_lower and len(dealer.name) < 50:
-                if self.debug:
-                    print(f"    Skipped (matches skip pattern): {dealer.name}")
-                return False
+        if len(dealer.name) < 50 and self._SKIP_RE.search(dealer.name):
+            if self.debug:
+                print(f"    Skipped (matches skip pattern): {dealer.name}")
+            return False
 
         return True
 
+    def _winner_first(self, key: str, selectors) -> List[str]:
+        """
+        Order selectors so the one that last matched for key is tried first.
+
+        Args:
+            key: Selector group name (e.g. 'dealer_cards')
+            selectors: Candidate selectors in configured order
+
+        Returns:
+            List of selectors, previous winner first when it is a candidate
+        """
+        selectors = list(selectors)
+        winner = self._winning_selectors.get(key)
+        if winner in selectors:
+            selectors.remove(winner)
+            selectors.insert(0, winner)
+        return selectors
+
+    def _record_winner(self, key: str, selector: str):
+        """Remember the selector that matched for key for the rest of this run."""
+        self._winning_selectors[key] = selector
+
     async def _handle_cookie_popup(self):
         """Handle common cookie consent popups."""
         cookie_selectors = [
@@ -1439,7 +1817,12 @@ def load_websites(websites_file: str) -> List[str]:
             if line and line.startswith(('http://', 'https://')):
                 urls.append(line)
 
-    return urls
+    # A page listed twice (even as http:// vs https://, with or without
+    # www. or a trailing slash) would be scraped twice into the same files
+    unique = {}
+    for url in urls:
+        unique.setdefault(_site_key(url), url)
+    return list(unique.values())
 
 
 def load_zip_codes(zip_codes_arg: str, zip_file: str) -> List[str]:
@@ -1447,9 +1830,10 @@ def load_zip_codes(zip_codes_arg: str, zip_file: str) -> List[str]:
     codes = []
 
     if zip_codes_arg:
-        codes = [z.strip() for z in zip_codes_arg.split(",") if z.strip()]
+        codes = list(dict.fromkeys(z.strip() for z in zip_codes_arg.split(",") if z.strip()))
 
     if zip_file and os.path.exists(zip_file):
+        seen = set(codes)
         with open(zip_file, 'r') as f:
             for line in f:
                 line = line.strip()
@@ -1457,159 +1841,394 @@ def load_zip_codes(zip_codes_arg: str, zip_file: str) -> List[str]:
                     continue
                 if '#' in line:
                     line = line.split('#')[0].strip()
-                if line and line not in codes:
+                if line and line not in seen:
+                    seen.add(line)
                     codes.append(line)
 
     return codes if codes else ["10001"]
 
 
-def save_results(dealers: List[Dealer], output_dir: str, domain: str):
-    """Save dealers to CSV and JSON files."""
-    os.makedirs(output_dir, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+# Write buffer for output files (fewer write syscalls on large result sets)
+OUTPUT_BUFFER_SIZE = 1 << 20
 
-    # Clean domain for filename
-    clean_domain = domain.replace('.', '_')
 
-    # CSV
-    csv_path = os.path.join(output_dir, f"{clean_domain}_dealers_{timestamp}.csv")
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        if dealers:
-            writer = csv.DictWriter(f, fieldnames=asdict(dealers[0]).keys())
-            writer.writeheader()
-            for d in dealers:
-                writer.writerow(asdict(d))
-    print(f"Saved CSV: {csv_path}")
+def _open_output(path: Path, compress: bool = False, binary: bool = False, **kwargs):
+    """Open an output file for text (or binary) writing, gzip-compressed when requested."""
+    if compress:
+        kwargs.pop('buffering', None)
+        return gzip.open(path, 'wb' if binary else 'wt', compresslevel=3, **kwargs)
+    return open(path, 'wb' if binary else 'w', **kwargs)
 
-    # JSON
-    json_path = os.path.join(output_dir, f"{clean_domain}_dealers_{timestamp}.json")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump([asdict(d) for d in dealers], f, indent=2)
-    print(f"Saved JSON: {json_path}")
 
+def run_timestamp() -> str:
+    """Timestamp used in output file names (shared by all sites in a run)."""
+    return time.strftime("%Y%m%d_%H%M%S")
 
-async def scrape_website(
-    url: str,
-    zip_codes: List[str],
-    headless: bool = True,
-    enable_ai: bool = True
-) -> List[Dealer]:
+
+def _site_key(url: str) -> str:
     """
-    Scrape a single website for dealers.
+    Normalize a website URL so spellings of the same page compare equal.
+
+    The scheme, port, a leading www. and a trailing / are dropped and the
+    host is lowercased.
 
     Args:
         url: Dealer locator URL
-        zip_codes: List of zip codes
-        headless: Run browser in headless mode
-        enable_ai: Enable AI features
 
     Returns:
-        List of Dealer objects
+        Normalized URL, e.g. 'ford.com/dealerships'
     """
-    scraper = GenericDealerScraper(url, headless=headless, enable_ai=enable_ai)
-    return await scraper.scrape(zip_codes)
+    parsed = urlparse(url)
+    host = parsed.hostname or ''
+    if host.startswith('www.'):
+        host = host[len('www.'):]
+    key = host + parsed.path.rstrip('/')
+    return f"{key}?{parsed.query}" if parsed.query else key
 
 
-def _worker_scrape(args: Tuple[str, List[str], bool, bool]) -> List[Dict]:
+def site_file_name(url: str) -> str:
     """
-    Worker function for parallel scraping.
+    Build the output file name prefix for a website.
+
+    The URL path is included alongside the domain, so two locator pages on
+    the same domain scraped in one run never share (or overwrite) files.
+    Distinct URLs can still slug to the same prefix (e.g. '/a-b' and
+    '/a_b'); site_file_names resolves those for a run.
 
     Args:
-        args: Tuple of (url, zip_codes, headless, enable_ai)
+        url: Dealer locator URL
 
     Returns:
-        List of dealer dictionaries
+        File-name-safe prefix, e.g. 'ford_com_dealerships'
     """
-    url, zip_codes, headless, enable_ai = args
+    return re.sub(r'[^a-z0-9]+', '_', _site_key(url).lower()).strip('_')
 
-    # Run async scraper in sync context
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
 
-    try:
-        dealers = loop.run_until_complete(
-            scrape_website(url, zip_codes, headless, enable_ai)
+def site_file_names(urls: Iterable[str]) -> Dict[str, str]:
+    """
+    Assign each website a file name prefix no other website in the run has.
+
+    A prefix already taken gets a numeric suffix (_2, _3, ...) rather than
+    letting the later site overwrite the earlier one's files.
+
+    Args:
+        urls: Dealer locator URLs scraped in one run
+
+    Returns:
+        Dict of URL to file name prefix
+    """
+    names = {}
+    taken = set()
+    for url in urls:
+        if url in names:
+            continue
+        base = name = site_file_name(url)
+        suffix = 2
+        while name in taken:
+            name = f"{base}_{suffix}"
+            suffix += 1
+        taken.add(name)
+        names[url] = name
+    return names
+
+
+def _output_paths(
+    output_dir: Path,
+    site: str,
+    compress: bool = False,
+    timestamp: Optional[str] = None
+) -> Tuple[Path, Path]:
+    """Build timestamped CSV and JSON output paths for a site (output_dir must exist)."""
+    timestamp = timestamp or run_timestamp()
+
+    suffix = ".gz" if compress else ""
+    csv_path = output_dir / f"{site}_dealers_{timestamp}.csv{suffix}"
+    json_path = output_dir / f"{site}_dealers_{timestamp}.json{suffix}"
+    return csv_path, json_path
+
+
+class DealerResultWriter:
+    """
+    Incrementally writes one site's dealers to CSV and JSON as they are found.
+
+    Files are opened on the first non-empty batch, so a site without results
+    leaves no empty artifacts behind.
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        site: str,
+        pretty: bool = False,
+        compress: bool = False,
+        timestamp: Optional[str] = None
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            output_dir: Existing output directory
+            site: File name prefix for the site (see site_file_name)
+            pretty: Indent JSON records
+            compress: Write gzip-compressed .csv.gz/.json.gz files
+            timestamp: Run timestamp for file names (defaults to now)
+        """
+        self.output_dir = output_dir
+        self.site = site
+        self.compress = compress
+        self.timestamp = timestamp
+        self.pretty = pretty
+        self.count = 0
+        self.duplicates = 0
+        self._seen_keys = set()
+        self.csv_path: Optional[Path] = None
+        self.json_path: Optional[Path] = None
+        self._csv_file = None
+        self._json_file = None
+        self._csv_writer = None
+
+    def _open(self):
+        """Open both output files and write their headers."""
+        self.csv_path, self.json_path = _output_paths(
+            self.output_dir, self.site, self.compress, self.timestamp
         )
-        return [asdict(d) for d in dealers]
-    except Exception as e:
-        print(f"Worker error for {url}: {e}")
-        return []
-    finally:
-        loop.close()
+        self._csv_file = _open_output(
+            self.csv_path, self.compress, newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE
+        )
+        self._json_file = _open_output(
+            self.json_path, self.compress, binary=True, buffering=OUTPUT_BUFFER_SIZE
+        )
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(_DEALER_FIELDS)
+        self._json_file.write(b"[\n")
+
+    def write(self, dealers: Iterable[Dealer]):
+        """
+        Append a batch of dealers to both files, skipping ones already written.
+
+        Each dealer's field values are read once and fed to both the CSV and
+        JSON encoders in a single pass over the batch.
+
+        Args:
+            dealers: Dealers to append
+        """
+        for d in dealers:
+            key = _dealer_key(d)
+            if key in self._seen_keys:
+                self.duplicates += 1
+                continue
+            self._seen_keys.add(key)
+
+            if self._csv_file is None:
+                self._open()
+
+            row = _dealer_values(d)
+            self._csv_writer.writerow(row)
+            self._json_file.write((b",\n" if self.count else b"") + _row_json(row, self.pretty))
+            self.count += 1
 
+    def close(self):
+        """Finish the JSON array and close both files."""
+        if self.duplicates:
+            print(f"Skipped {self.duplicates} duplicate dealers ({self.count} unique)")
+        if self._csv_file is None:
+            return
+        self._json_file.write(b"\n]\n")
+        self._csv_file.close()
+        self._json_file.close()
+        self._csv_file = self._json_file = None
+        print(f"Saved CSV: {self.csv_path}")
+        print(f"Saved JSON: {self.json_path}")
 
-def scrape_parallel(
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CombinedResultWriter:
+    """
+    Appends every site's dealers to one combined CSV and JSON Lines artifact.
+
+    Each site's files are streamed in after that site finishes, so the
+    combined files never require holding more than one row in memory, and
+    sites scraped in other processes can be merged from the main process.
+    The per-site workers' already encoded CSV rows and compact JSON records
+    are copied as-is rather than parsed and re-encoded.
+    """
+
+    def __init__(self, output_dir: Path, timestamp: str, compress: bool = False,
+                 pretty: bool = False):
+        """
+        Open the combined output files.
+
+        Args:
+            output_dir: Existing output directory
+            timestamp: Run timestamp shared with the per-site files
+            compress: Read/write gzip-compressed files
+            pretty: Whether the per-site JSON records were indented (then
+                the site CSV is parsed to build the JSON Lines instead)
+        """
+        self.output_dir = output_dir
+        self.timestamp = timestamp
+        self.compress = compress
+        self.pretty = pretty
+        self.count = 0
+        self._appended = set()
+        suffix = ".gz" if compress else ""
+        self.csv_path = output_dir / f"all_sites_dealers_{timestamp}.csv{suffix}"
+        self.jsonl_path = output_dir / f"all_sites_dealers_{timestamp}.jsonl{suffix}"
+        self._csv_file = _open_output(
+            self.csv_path, compress, newline='', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE
+        )
+        self._jsonl_file = _open_output(
+            self.jsonl_path, compress, binary=True, buffering=OUTPUT_BUFFER_SIZE
+        )
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(_DEALER_FIELDS)
+
+    def append_site(self, site: str):
+        """
+        Append one site's saved dealers to the combined files.
+
+        Args:
+            site: File name prefix whose per-site CSV was written this run
+        """
+        if site in self._appended:
+            return
+        site_csv, site_json = _output_paths(self.output_dir, site, self.compress, self.timestamp)
+        if not site_csv.exists():
+            return
+        self._appended.add(site)
+
+        opener = gzip.open if self.compress else open
+        if self.pretty or not site_json.exists():
+            with opener(site_csv, 'rt', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Header
+                for row in reader:
+                    self._csv_writer.writerow(row)
+                    self._jsonl_file.write(_row_json(tuple(row)) + b"\n")
+                    self.count += 1
+            return
+
+        # Both writers emit the same CSV dialect, so rows copy over verbatim
+        with opener(site_csv, 'rt', newline='', encoding='utf-8') as f:
+            f.readline()  # Header (field names never contain newlines)
+            shutil.copyfileobj(f, self._csv_file)
+
+        # Compact site JSON holds one record per line between "[" and "]",
+        # each but the last followed by a "," separator
+        with opener(site_json, 'rb') as f:
+            for line in f:
+                line = line.rstrip(b"\r\n")
+                if line in (b"[", b"]") or not line:
+                    continue
+                if line.endswith(b","):
+                    line = line[:-1]
+                self._jsonl_file.write(line + b"\n")
+                self.count += 1
+
+    def close(self):
+        """Close the combined files."""
+        self._csv_file.close()
+        self._jsonl_file.close()
+        print(f"Saved combined CSV: {self.csv_path}")
+        print(f"Saved combined JSONL: {self.jsonl_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+async def scrape_site_to_files(
     url: str,
     zip_codes: List[str],
+    output_dir: Path,
+    timestamp: str,
     headless: bool = True,
-    workers: int = 4,
-    enable_ai: bool = True
-) -> List[Dealer]:
+    enable_ai: bool = True,
+    pretty: bool = False,
+    compress: bool = False,
+    concurrent_searches: Optional[int] = None,
+    site: Optional[str] = None
+) -> int:
     """
-    Scrape dealers using multiple parallel processes.
+    Scrape one website and write its CSV/JSON artifacts.
 
     Args:
         url: Dealer locator URL
         zip_codes: List of zip codes
-        headless: Run in headless mode
-        workers: Number of parallel workers
+        output_dir: Existing output directory
+        timestamp: Run timestamp for file names
+        headless: Run browser in headless mode
         enable_ai: Enable AI features
+        pretty: Indent JSON records
+        compress: Write gzip-compressed output
+        concurrent_searches: Zip searches to run at once in one browser
+            (default: interactions.concurrent_searches from the site config)
+        site: File name prefix for the site's artifacts (default:
+            site_file_name(url); see site_file_names for a whole run)
 
     Returns:
-        List of deduplicated Dealer objects
+        Number of dealers written
     """
-    workers = min(workers, len(zip_codes), 8)
-
-    if workers <= 1:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(
-                scrape_website(url, zip_codes, headless, enable_ai)
-            )
-        finally:
-            loop.close()
-
-    # Split zip codes among workers
-    chunks = [[] for _ in range(workers)]
-    for i, zc in enumerate(zip_codes):
-        chunks[i % workers].append(zc)
+    domain = GenericDealerScraper._extract_domain(url)
+    print(f"URL: {url}")
+    if concurrent_searches and concurrent_searches > 1:
+        print(f"Using {concurrent_searches} parallel workers")
+    print(f"{'='*60}")
 
-    chunks = [c for c in chunks if c]
-    actual_workers = len(chunks)
+    # Write each zip code's dealers as soon as they are scraped
+    scraper = GenericDealerScraper(
+        url, headless=headless, enable_ai=enable_ai, concurrent_searches=concurrent_searches
+    )
+    with DealerResultWriter(
+        output_dir, site or site_file_name(url),
+        pretty=pretty,
+        compress=compress,
+        timestamp=timestamp
+    ) as writer:
+        async for dealers in scraper.scrape_iter(zip_codes):
+            writer.write(dealers)
+    found = writer.count
+
+    if found:
+        print(f"\nTotal {domain} dealers found: {found}")
+    else:
+        print(f"\nNo dealers found for {domain}")
+    return found
 
-    print(f"\nStarting {actual_workers} parallel workers...")
-    print(f"Distributing {len(zip_codes)} zip codes across workers")
 
-    worker_args = [
-        (url, chunk, headless, enable_ai)
-        for chunk in chunks
-    ]
+def _site_worker(args: Tuple) -> int:
+    """
+    Process-pool entry point for scraping one website.
 
-    all_dealer_dicts = []
-    with ProcessPoolExecutor(max_workers=actual_workers) as executor:
-        futures = {executor.submit(_worker_scrape, args): i for i, args in enumerate(worker_args)}
+    Args:
+        args: Positional arguments for scrape_site_to_files
 
-        for future in as_completed(futures):
-            worker_id = futures[future]
-            try:
-                dealer_dicts = future.result()
-                all_dealer_dicts.extend(dealer_dicts)
-                print(f"[Worker {worker_id + 1}] Completed with {len(dealer_dicts)} dealers")
-            except Exception as e:
-                print(f"[Worker {worker_id + 1}] Failed: {e}")
+    Returns:
+        Number of dealers written (0 on error)
+    """
+    try:
+        return asyncio.run(scrape_site_to_files(*args))
+    except Exception as e:
+        print(f"Site worker error for {args[0]}: {e}")
+        return 0
 
-    # Deduplicate
-    seen = set()
-    dealers = []
-    for d in all_dealer_dicts:
-        key = f"{d['name'].lower()}|{d['address'].lower()}"
-        if key not in seen:
-            seen.add(key)
-            dealers.append(Dealer(**d))
 
-    print(f"\nTotal unique dealers after deduplication: {len(dealers)}")
-    return dealers
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 async def main_async():
@@ -1652,9 +2271,15 @@ async def main_async():
     )
     parser.add_argument(
         "--workers", "-w",
-        type=int,
+        type=_positive_int,
+        help="Zip searches to run at once per website, as tabs in one shared browser "
+             "(default: interactions.concurrent_searches from the site config)"
+    )
+    parser.add_argument(
+        "--site-workers",
+        type=_positive_int,
         default=1,
-        help="Number of parallel workers per website (default: 1)"
+        help="Number of websites to scrape at once, each in its own process (default: 1)"
     )
     parser.add_argument(
         "--enable-ai",
@@ -1667,6 +2292,21 @@ async def main_async():
         action="store_true",
         help="Disable AI features, use default selectors"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output records for readability"
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Write gzip-compressed output (.csv.gz/.json.gz)"
+    )
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help="Also write one combined CSV/JSONL with every website's dealers"
+    )
     parser.add_argument(
         "--list-websites",
         action="store_true",
@@ -1689,7 +2329,7 @@ async def main_async():
 
     # Configuration
     headless = not args.no_headless
-    workers = max(1, args.workers)
+    workers = args.workers
     enable_ai = args.enable_ai and not args.disable_ai
 
     if enable_ai:
@@ -1702,40 +2342,55 @@ async def main_async():
     print(f"Loaded {len(zip_codes)} zip codes")
     print(f"Loaded {len(websites)} websites to scrape")
 
-    # Scrape each website
-    all_dealers = []
-    for i, url in enumerate(websites):
-        domain = GenericDealerScraper._extract_domain(url)
-        print(f"\n{'='*60}")
-        print(f"[{i+1}/{len(websites)}] Scraping {domain}...")
-        print(f"URL: {url}")
-        if workers > 1:
-            print(f"Using {workers} parallel workers")
-        print(f"{'='*60}")
-
-        if workers > 1:
-            dealers = scrape_parallel(
-                url, zip_codes,
-                headless=headless,
-                workers=workers,
-                enable_ai=enable_ai
-            )
-        else:
-            dealers = await scrape_website(
-                url, zip_codes,
-                headless=headless,
-                enable_ai=enable_ai
-            )
+    # Scrape each website (one timestamp so a run's artifacts sort together)
+    total_dealers = 0
+    timestamp = run_timestamp()
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Unique per run, so no site's files overwrite another's
+    site_names = site_file_names(websites)
+    site_args = [
+        (
+            url, zip_codes, output_dir, timestamp, headless, enable_ai,
+            args.pretty, args.compress, workers, site_names[url]
+        )
+        for url in websites
+    ]
+    site_workers = min(args.site_workers, len(websites), os.cpu_count() or 1)
+    combined = (
+        CombinedResultWriter(output_dir, timestamp, args.compress, pretty=args.pretty)
+        if args.combined else None
+    )
 
-        if dealers:
-            print(f"\nTotal {domain} dealers found: {len(dealers)}")
-            save_results(dealers, args.output_dir, domain)
-            all_dealers.extend(dealers)
+    try:
+        if site_workers > 1:
+            # Sites are independent, so scrape several at once in separate processes
+            print(f"\nScraping {len(websites)} websites with {site_workers} site workers")
+            with ProcessPoolExecutor(max_workers=site_workers) as executor:
+                futures = {executor.submit(_site_worker, site): site[0] for site in site_args}
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        total_dealers += future.result()
+                    except Exception as e:
+                        print(f"Site worker failed for {url}: {e}")
+                        continue
+                    if combined:
+                        combined.append_site(site_names[url])
         else:
-            print(f"\nNo dealers found for {domain}")
+            for i, (url, *rest) in enumerate(site_args):
+                domain = GenericDealerScraper._extract_domain(url)
+                print(f"\n{'='*60}")
+                print(f"[{i+1}/{len(websites)}] Scraping {domain}...")
+                total_dealers += await scrape_site_to_files(url, *rest)
+                if combined:
+                    combined.append_site(site_names[url])
+    finally:
+        if combined:
+            combined.close()
 
     print(f"\n{'='*60}")
-    print(f"COMPLETE: Found {len(all_dealers)} dealers across all websites")
+    print(f"COMPLETE: Found {total_dealers} dealers across all websites")
     print(f"{'='*60}")
 
 
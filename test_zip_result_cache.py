@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-zip result cache.
+
+Checks that two locator pages on the same domain keep separate cached
+results for the same zip code.
+"""
+
+import tempfile
+from pathlib import Path
+
+from utils.zip_result_cache import ZipResultCache
+
+
+def test_same_domain_urls_cached_separately():
+    """Results for one locator URL are never served for another on the same domain."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ZipResultCache(schema="name,zip_code", path=str(Path(tmp) / "cache.db"))
+        try:
+            dealerships = "https://www.ford.com/dealerships/"
+            commercial = "https://www.ford.com/commercial-trucks/dealerships/"
+
+            cache.put(dealerships, "10001", [("Ford of Manhattan", "10001")])
+            assert cache.get(commercial, "10001") is None
+
+            cache.put(commercial, "10001", [("Manhattan Commercial Ford", "10001")])
+            assert cache.get(dealerships, "10001") == [("Ford of Manhattan", "10001")]
+            assert cache.get(commercial, "10001") == [("Manhattan Commercial Ford", "10001")]
+        finally:
+            cache.close()
+
+
+if __name__ == "__main__":
+    test_same_domain_urls_cached_separately()
+    print("Zip result cache tests passed")
@@ -8,6 +8,7 @@ Handles form submission, virtual scrolling, and dealer card extraction.
 import asyncio
 import json
 import os
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 from crawl4ai.async_configs import CrawlerRunConfig as RunConfig
@@ -18,16 +19,213 @@ from bs4 import BeautifulSoup
 class Crawl4AIScraper:
     """Crawl4AI-based scraper for dealer locator pages."""
 
-    def __init__(self, headless: bool = True, verbose: bool = False):
+    # Records JSON fetch/XHR responses from locator-like URLs into a
+    # <script id="__dealer_xhr"> element, so the returned HTML carries the
+    # structured data the result cards are rendered from
+    XHR_CAPTURE_JS = """
+    (() => {
+        if (window.__dealerXhrInstalled) {
+            return;
+        }
+        window.__dealerXhrInstalled = true;
+        const urlPattern = /dealer|locat|store|search|result/i;
+        const maxPayloads = 20;
+        const payloads = [];
+        const record = (url, text) => {
+            if (!text || payloads.length >= maxPayloads || !urlPattern.test(url || '')) {
+                return;
+            }
+            const first = text.trimStart()[0];
+            if (first !== '{' && first !== '[') {
+                return;
+            }
+            payloads.push(text);
+            let node = document.getElementById('__dealer_xhr');
+            if (!node) {
+                node = document.createElement('script');
+                node.type = 'application/json';
+                node.id = '__dealer_xhr';
+                document.body.appendChild(node);
+            }
+            // Escape '<' so a payload can never close the script element
+            node.textContent = JSON.stringify(payloads).replace(/</g, '\\\\u003c');
+        };
+        const originalFetch = window.fetch;
+        if (originalFetch) {
+            window.fetch = function(...args) {
+                return originalFetch.apply(this, args).then(response => {
+                    try {
+                        response.clone().text().then(text => record(response.url, text)).catch(() => {});
+                    } catch (e) {}
+                    return response;
+                });
+            };
+        }
+        const originalOpen = XMLHttpRequest.prototype.open;
+        XMLHttpRequest.prototype.open = function(method, url, ...rest) {
+            this.addEventListener('load', () => {
+                try {
+                    if (this.responseType === '' || this.responseType === 'text') {
+                        record(String(url), this.responseText);
+                    }
+                } catch (e) {}
+            });
+            return originalOpen.call(this, method, url, ...rest);
+        };
+    })();
+    """
+
+    # Requests the dealer HTML/JSON never depends on. Stylesheets and
+    # scripts still load since they drive how the result list renders.
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+    BLOCKED_URL_PARTS = (
+        'google-analytics', 'googletagmanager', 'doubleclick', 'adobedtm',
+    )
+
+    def __init__(self, headless: bool = True, verbose: bool = False,
+                 block_resources: bool = True, recycle_after: int = 50,
+                 cdp_url: Optional[str] = None):
         """
         Initialize Crawl4AI scraper.
 
         Args:
             headless: Run browser in headless mode
             verbose: Enable verbose logging
+            block_resources: Abort image, media, font and analytics requests
+            recycle_after: Relaunch the browser after this many searches
+                (0 keeps one browser for the whole run)
+            cdp_url: DevTools endpoint of an already running Chrome to connect
+                to instead of launching one (default: BROWSER_CDP_URL env var)
         """
         self.headless = headless
         self.verbose = verbose
+        self.block_resources = block_resources
+        self.cdp_url = cdp_url or os.getenv('BROWSER_CDP_URL') or None
+        # A connected browser is long-lived by design and not ours to restart
+        self.recycle_after = 0 if self.cdp_url else recycle_after
+        # One browser shared by every search, started on first use
+        self._crawler: Optional[AsyncWebCrawler] = None
+        self._crawler_lock = asyncio.Lock()
+        # Long-lived Chromium slows down as memory and cache grow, so the
+        # browser is restarted every recycle_after searches once it's idle
+        self._searches_since_launch = 0
+        self._active_searches = 0
+        # Headed runs leave the latest search's page open for inspection
+        self._inspected_session: Optional[str] = None
+
+    async def get_crawler(self) -> AsyncWebCrawler:
+        """
+        Get the shared crawler, launching the browser on first use.
+
+        Returns:
+            Started AsyncWebCrawler instance
+        """
+        async with self._crawler_lock:
+            if self._crawler is None:
+                browser_options = {}
+                if self.cdp_url:
+                    # Every scraper process shares one Chrome instead of
+                    # each starting its own
+                    browser_options['cdp_url'] = self.cdp_url
+                browser_config = BrowserConfig(
+                    headless=self.headless,
+                    verbose=self.verbose,
+                    **browser_options
+                )
+                crawler = AsyncWebCrawler(config=browser_config)
+                if self.block_resources:
+                    crawler.crawler_strategy.set_hook(
+                        'on_page_context_created', self._block_heavy_requests
+                    )
+                await crawler.start()
+                self._crawler = crawler
+            return self._crawler
+
+    @classmethod
+    async def _block_heavy_requests(cls, page, context=None, **kwargs):
+        """
+        Crawl4AI page hook: route the page's requests through _route_request.
+
+        Args:
+            page: Newly created Playwright page
+
+        Returns:
+            The same page
+        """
+        await page.route('**/*', cls._route_request)
+        return page
+
+    @classmethod
+    async def _route_request(cls, route):
+        """
+        Abort requests for resources the scraper never reads.
+
+        Args:
+            route: Playwright route for the intercepted request
+        """
+        request = route.request
+        url = request.url.lower()
+        if (request.resource_type in cls.BLOCKED_RESOURCE_TYPES
+                or any(part in url for part in cls.BLOCKED_URL_PARTS)):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    @asynccontextmanager
+    async def _session_crawler(self, session_id: Optional[str] = None):
+        """
+        Borrow the shared crawler for one search.
+
+        The browser stays running afterwards; only the search's session
+        (page) is closed. With headless=False the latest search's page stays
+        open for inspection and is closed when the next search finishes.
+
+        Args:
+            session_id: Session used by the search, if any
+        """
+        crawler = await self.get_crawler()
+        self._active_searches += 1
+        try:
+            yield crawler
+        finally:
+            self._active_searches -= 1
+            self._searches_since_launch += 1
+            if session_id and not self.headless:
+                # Only the newest page stays open, so a long headed run
+                # doesn't pile up one page per search in the shared browser
+                session_id, self._inspected_session = self._inspected_session, session_id
+            if session_id:
+                try:
+                    await crawler.crawler_strategy.kill_session(session_id)
+                except Exception:
+                    pass
+            await self._maybe_recycle()
+
+    async def _maybe_recycle(self):
+        """Close the shared browser when it is due for a restart and idle."""
+        if (not self.recycle_after
+                or self._searches_since_launch < self.recycle_after
+                or self._active_searches):
+            return
+        async with self._crawler_lock:
+            if self._crawler is None or self._active_searches:
+                return
+            if self.verbose:
+                print(f"  Recycling browser after {self._searches_since_launch} searches")
+            crawler, self._crawler = self._crawler, None
+            self._searches_since_launch = 0
+            self._inspected_session = None
+            try:
+                await crawler.close()
+            except Exception as e:
+                print(f"  Warning: Failed to close browser while recycling: {e}")
+
+    async def close(self):
+        """Shut down the shared browser, if it was started."""
+        if self._crawler is not None:
+            crawler, self._crawler = self._crawler, None
+            self._inspected_session = None
+            await crawler.close()
 
     @staticmethod
     def _escape_js_string(s: str) -> str:
@@ -45,6 +243,49 @@ class Crawl4AIScraper:
         # Escape single quotes, backslashes, and newlines
         return s.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n').replace('\r', '\\r')
 
+    @staticmethod
+    def _load_more_click_js(selector: str, timeout_ms: int = 3000,
+                            card_selector: str = '', max_cards: int = 0) -> str:
+        """
+        Build JavaScript that clicks a Load More button and waits for new content.
+
+        Instead of a fixed sleep after the click, the DOM element count is
+        polled every 100ms and the script returns as soon as it grows (or
+        after timeout_ms when nothing new arrives).
+
+        Args:
+            selector: JS-escaped CSS selector for the button
+            timeout_ms: Maximum time to wait for new elements
+            card_selector: JS-escaped dealer card selector, for max_cards
+            max_cards: Don't click once this many cards are shown (0 = no limit)
+
+        Returns:
+            JavaScript code returning true if the button was clicked
+        """
+        limit_check = ""
+        if card_selector and max_cards:
+            limit_check = f"""
+        try {{
+            if (document.querySelectorAll('{card_selector}').length >= {int(max_cards)}) {{
+                return false;
+            }}
+        }} catch (e) {{}}"""
+        return f"""{limit_check}
+        const btn = document.querySelector('{selector}');
+        if (btn && btn.offsetParent !== null) {{
+            const before = document.getElementsByTagName('*').length;
+            btn.click();
+            for (let waited = 0; waited < {timeout_ms}; waited += 100) {{
+                await new Promise(r => setTimeout(r, 100));
+                if (document.getElementsByTagName('*').length > before) {{
+                    break;
+                }}
+            }}
+            return true;
+        }}
+        return false;
+        """
+
     def _get_llm_config(self, config: Dict) -> tuple:
         """
         Get LLM provider configuration from environment/config.
@@ -523,15 +764,7 @@ if (btn) {
             js_code = template.replace('{LOAD_MORE_SELECTOR}', load_more_selector)
         else:
             # Default implementation
-            js_code = f"""
-const btn = document.querySelector('{load_more_selector}');
-if (btn && btn.offsetParent !== null) {{
-    btn.click();
-    await new Promise(r => setTimeout(r, 1500));
-    return true;
-}}
-return false;
-"""
+            js_code = self._load_more_click_js(self._escape_js_string(load_more_selector))
 
         return js_code
 
@@ -577,25 +810,24 @@ return false;
                 if self.verbose:
                     print(f"  Direct URL: {direct_url}")
 
-                browser_config = BrowserConfig(
-                    headless=self.headless,
-                    verbose=self.verbose
-                )
-
-                async with AsyncWebCrawler(config=browser_config) as crawler:
+                async with self._session_crawler() as crawler:
                     # Wait longer for AJAX-loaded dealers
                     wait_time = config.get('interactions', {}).get('wait_after_page_load', 15)
 
+                    # Return from navigation at DOMContentLoaded and let the
+                    # readiness poll below decide when dealers are in; the
+                    # configured wait is the poll's upper bound.
+                    # The poll must be returned so the crawler awaits it
+                    # before reading the HTML.
                     run_config = CrawlerRunConfig(
                         page_timeout=45000,  # 45 second timeout
-                        delay_before_return_html=wait_time,  # Wait for AJAX dealers
-                        js_code="""
+                        wait_until="domcontentloaded",
+                        delay_before_return_html=0.5,
+                        js_code=f"const maxWait = {int(wait_time)};  // seconds\n" + """
                         // Wait for dealer cards to load
-                        (async () => {
+                        return await (async () => {
                             console.log('[DEBUG] Waiting for dealers to load via AJAX...');
 
-                            const maxWait = 30;  // 30 seconds
-
                             for (let i = 0; i < maxWait; i++) {
                                 await new Promise(r => setTimeout(r, 1000));
 
@@ -646,23 +878,27 @@ return false;
                         print(f"  Failed to load direct URL: {result.error_message if hasattr(result, 'error_message') else 'Unknown'}")
                         return None
 
-            # Configure browser
-            browser_config = BrowserConfig(
-                headless=self.headless,
-                verbose=self.verbose
-            )
-
-            async with AsyncWebCrawler(config=browser_config) as crawler:
+            # Reuse the shared browser; each search gets its own session
+            async with self._session_crawler(session_id) as crawler:
                 # Step 1: Navigate and discover form fields with LLM
                 if self.verbose:
                     print(f"  Navigating to {url}")
                     print(f"  Executing search for zip code: {zip_code}")
 
                 # Check if page has iframes and enable iframe processing if needed
+                # Don't wait on images/analytics: return at DOMContentLoaded and
+                # poll until the search form is rendered (3s at most)
                 initial_config = CrawlerRunConfig(
                     session_id=session_id,  # CRITICAL: Use session_id from the start
                     page_timeout=30000,
-                    delay_before_return_html=3  # Wait for JS to load and render
+                    wait_until="domcontentloaded",
+                    js_code="""
+                    for (let waited = 0; waited < 3000; waited += 100) {
+                        if (document.querySelector('input:not([type="hidden"]), iframe')) break;
+                        await new Promise(r => setTimeout(r, 100));
+                    }
+                    """,
+                    delay_before_return_html=0.3
                 )
                 initial_result = await crawler.arun(url=url, config=initial_config)
 
@@ -688,7 +924,10 @@ return false;
                 # Escape selectors for JavaScript
                 zip_input_selector = self._escape_js_string(discovered_selectors['zip_input'])
 
-                fill_js = f"""
+                # Start capturing the search XHRs before the form is touched
+                # (only for sites that opt in to XHR-based extraction)
+                capture_js = self.XHR_CAPTURE_JS if config.get('interactions', {}).get('use_xhr_results', False) else ""
+                fill_js = capture_js + f"""
                 console.log('[DEBUG] Looking for zip input with selector:', '{zip_input_selector}');
                 const input = document.querySelector('{zip_input_selector}');
                 if (input) {{
@@ -796,15 +1035,22 @@ return false;
                         btn.click();
                         console.log('[DEBUG] Clicked button');
 
-                        // Wait a bit to see if Advanced Search modal opened or results loaded
-                        await new Promise(r => setTimeout(r, 2000));
-
-                        // Check if Advanced Search modal/filters appeared and need to be dismissed
-                        const applyButtons = Array.from(document.querySelectorAll('button')).filter(b => {{
+                        // Wait (up to 2s) until results load or an Advanced Search modal opens
+                        const findApplyButtons = () => Array.from(document.querySelectorAll('button')).filter(b => {{
                             const text = b.textContent.trim().toLowerCase();
                             const isVisible = b.offsetParent !== null;
                             return isVisible && (text === 'apply' || text === 'done' || text === 'close');
                         }});
+                        let applyButtons = [];
+                        for (let waited = 0; waited < 2000; waited += 100) {{
+                            await new Promise(r => setTimeout(r, 100));
+                            applyButtons = findApplyButtons();
+                            if (applyButtons.length > 0 || document.querySelector('{dealer_card_selector}')) {{
+                                break;
+                            }}
+                        }}
+
+                        // Check if Advanced Search modal/filters appeared and need to be dismissed
 
                         if (applyButtons.length > 0) {{
                             console.log('[DEBUG] Found Apply/Done/Close button, clicking it to dismiss modal');
@@ -839,19 +1085,20 @@ return false;
 
                     // Wait for dealer cards to appear after submit
                     console.log('[DEBUG] Waiting for dealer cards with selector:', '{dealer_card_selector}');
-                    const maxWait = 30; // 30 seconds max
-                    for (let i = 0; i < maxWait; i++) {{
-                        await new Promise(r => setTimeout(r, 1000));
+                    // Poll every 250ms (30 seconds max) so the script returns as soon as cards render
+                    const maxPolls = 120;
+                    for (let i = 0; i < maxPolls; i++) {{
                         const cards = document.querySelectorAll('{dealer_card_selector}');
                         if (cards && cards.length > 0) {{
-                            console.log(`[DEBUG] Found ${{cards.length}} dealer cards after ${{i+1}} seconds`);
+                            console.log(`[DEBUG] Found ${{cards.length}} dealer cards after ${{i * 0.25}} seconds`);
                             return true;
                         }}
+                        await new Promise(r => setTimeout(r, 250));
 
                         // Every 5 seconds, try to find potential dealer elements
-                        if (i % 5 === 0) {{
+                        if (i % 20 === 0) {{
                             const anyCards = document.querySelectorAll('[class*="dealer"], [class*="location"], [class*="result"], [class*="store"], li, article');
-                            console.log(`[DEBUG] After ${{i+1}}s - Potential dealer elements found:`, anyCards.length);
+                            console.log(`[DEBUG] After ${{i * 0.25}}s - Potential dealer elements found:`, anyCards.length);
 
                             // Check if URL changed (indicates navigation happened)
                             console.log('[DEBUG] Current URL:', window.location.href);
@@ -896,8 +1143,8 @@ return false;
 
                 html = result.html
 
-                # Check if dealer cards appeared
-                soup = BeautifulSoup(html, 'html.parser')
+                # Check if dealer cards appeared (lxml: fast C parser)
+                soup = BeautifulSoup(html, 'lxml')
                 cards = soup.select(dealer_card_selector)
 
                 if not cards:
@@ -956,7 +1203,8 @@ return false;
 
                     if pagination_type == 'view_more':
                         html = await self._expand_with_view_more(
-                            crawler, url, html, discovered_selectors, session_id, has_iframes
+                            crawler, url, html, discovered_selectors, session_id, has_iframes,
+                            max_cards=config.get('interactions', {}).get('max_dealers_per_zip') or 0
                         )
                     elif pagination_type == 'virtual_scroll':
                         html = await self._expand_with_virtual_scroll(
@@ -1004,7 +1252,8 @@ return false;
         html: str,
         discovered_selectors: Dict[str, str],
         session_id: str,
-        process_iframes: bool = False
+        process_iframes: bool = False,
+        max_cards: int = 0
     ) -> str:
         """
         Click "View More" / "Load More" buttons using LLM-discovered selector.
@@ -1016,6 +1265,8 @@ return false;
             discovered_selectors: Dict with 'view_more_button' key from LLM discovery
             session_id: Session ID to maintain browser state
             process_iframes: Whether to process iframe content
+            max_cards: Stop expanding once this many dealer cards are shown
+                (0 = expand until the button disappears)
 
         Returns:
             Expanded HTML with all results
@@ -1034,15 +1285,13 @@ return false;
         # Escape selector for JavaScript
         view_more_escaped = self._escape_js_string(view_more_selector)
 
-        load_more_js = f"""
-        const btn = document.querySelector('{view_more_escaped}');
-        if (btn && btn.offsetParent !== null) {{
-            btn.click();
-            await new Promise(r => setTimeout(r, 1500));
-            return true;
-        }}
-        return false;
-        """
+        # With a card limit, the script stops clicking (so the HTML stops
+        # growing and the loop below ends) once enough dealers are shown
+        load_more_js = self._load_more_click_js(
+            view_more_escaped,
+            card_selector=self._escape_js_string(discovered_selectors.get('dealer_cards') or ''),
+            max_cards=max_cards
+        )
 
         max_clicks = 30  # Maximum expansion iterations
 
@@ -1116,9 +1365,19 @@ return false;
     const container = document.querySelector('{container_escaped}');
     if (!container) return false;
 
+    // Read the scroll state once per step; stop early once the bottom is
+    // reached and two more waits load nothing new
+    let idle = 0;
     for (let i = 0; i < {scroll_count}; i++) {{
-        container.scrollTop += container.clientHeight;
+        const {{ scrollTop, scrollHeight, clientHeight }} = container;
+        const bottom = scrollHeight - clientHeight;
+        container.scrollTop = Math.min(scrollTop + clientHeight, bottom);
         await new Promise(r => setTimeout(r, 500));
+        if (scrollTop >= bottom - 1 && container.scrollHeight === scrollHeight) {{
+            if (++idle >= 2) break;
+        }} else {{
+            idle = 0;
+        }}
     }}
 
     return true;
@@ -1171,9 +1430,19 @@ return false;
 
         scroll_js = f"""
 (async () => {{
+    // Same early stop as the virtual scroll, on the document scroller
+    const scroller = document.scrollingElement || document.documentElement;
+    let idle = 0;
     for (let i = 0; i < {scroll_count}; i++) {{
-        window.scrollBy(0, window.innerHeight);
+        const {{ scrollTop, scrollHeight, clientHeight }} = scroller;
+        const bottom = scrollHeight - clientHeight;
+        scroller.scrollTop = Math.min(scrollTop + clientHeight, bottom);
         await new Promise(r => setTimeout(r, 500));
+        if (scrollTop >= bottom - 1 && scroller.scrollHeight === scrollHeight) {{
+            if (++idle >= 2) break;
+        }} else {{
+            idle = 0;
+        }}
     }}
 
     return true;
@@ -1234,11 +1503,14 @@ async def test_scraper():
 
     scraper = Crawl4AIScraper(headless=False, verbose=True)
 
-    html = await scraper.scrape_with_search(
-        url="https://www.ford.com/dealerships/",
-        zip_code="10001",
-        config=config
-    )
+    try:
+        html = await scraper.scrape_with_search(
+            url="https://www.ford.com/dealerships/",
+            zip_code="10001",
+            config=config
+        )
+    finally:
+        await scraper.close()
 
     if html:
         print(f"\nScrape successful! HTML length: {len(html)}")
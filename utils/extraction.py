@@ -7,9 +7,55 @@ phone numbers, addresses, websites, and names with multiple format support.
 """
 
 import re
-from typing import Optional, Tuple, List
+from functools import lru_cache
+from typing import Optional, Tuple, List, Pattern, Union
 from urllib.parse import urlparse
 
+# Patterns compiled once at import instead of looked up in re's cache per call
+_PHONE_PATTERNS = (
+    re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # Standard US format
+    re.compile(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'),  # Without parentheses
+    re.compile(r'\+?1[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # With country code
+)
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
+_ADDRESS_PATTERNS = (
+    re.compile(r'(?P<street>.+?),\s*(?P<city>[A-Za-z\s]+),\s*(?P<state>[A-Z]{2})\s+(?P<zip>\d{5}(?:-\d{4})?)'),
+    re.compile(r'(?P<street>.+?)\s+(?P<city>[A-Za-z\s]+),\s*(?P<state>[A-Z]{2})\s+(?P<zip>\d{5}(?:-\d{4})?)'),
+    re.compile(r'(?P<street>.+?)\s+(?P<state>[A-Z]{2})\s+(?P<zip>\d{5}(?:-\d{4})?)'),  # Missing city
+)
+# Every address pattern needs five digits in a row; without them, skip the
+# (backtracking-heavy) pattern searches entirely
+_FIVE_DIGITS_RE = re.compile(r'\d{5}')
+_ZIP_RE = re.compile(r'\b(\d{5}(?:-\d{4})?)\b')
+_STATE_RE = re.compile(r'\b([A-Z]{2})\b')
+
+_URL_PATTERNS = (
+    re.compile(r'https?://[^\s<>"\'\)]+'),
+    re.compile(r'www\.[^\s<>"\'\)]+'),
+)
+
+_LIST_PREFIX_RE = re.compile(r'^\d+\.\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_DEFAULT_SKIP_NAMES_RE = re.compile('|'.join(map(re.escape, (
+    'search by', 'location', 'name', 'clear', 'advanced search',
+    'view map', 'make my dealer', 'chat with dealer', 'dealer website',
+    'find more', 'view more', 'load more', 'show more', 'see more',
+))))
+
+_DISTANCE_PATTERNS = (
+    re.compile(r'([\d.]+)\s*mi\b'),
+    re.compile(r'([\d.]+)\s*miles?\b'),
+    re.compile(r'([\d.]+)\s*mi\.'),
+)
+
+
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple["re.Pattern", ...]:
+    """Compile caller-supplied (e.g. per-site config) patterns once."""
+    return tuple(re.compile(pattern) for pattern in patterns)
+
 
 def extract_phone(text: str, patterns: Optional[List[str]] = None) -> str:
     """
@@ -30,18 +76,16 @@ def extract_phone(text: str, patterns: Optional[List[str]] = None) -> str:
         Extracted phone number or empty string
     """
     if patterns is None:
-        patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # Standard US format
-            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Without parentheses
-            r'\+?1[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # With country code
-        ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+        compiled = _PHONE_PATTERNS
+    else:
+        compiled = _compile_patterns(tuple(patterns))
+
+    for pattern in compiled:
+        match = pattern.search(text)
         if match:
             phone = match.group()
             # Normalize phone number
-            phone = re.sub(r'[^\d]', '', phone)
+            phone = _NON_DIGIT_RE.sub('', phone)
             if len(phone) == 10:
                 return f"({phone[0:3]}) {phone[3:6]}-{phone[6:10]}"
             elif len(phone) == 11 and phone[0] == '1':
@@ -65,28 +109,24 @@ def parse_address(text: str) -> Tuple[str, str, str, str]:
     """
     # Common US address pattern: Street, City, State ZIP
     # Example: "123 Main St, Anytown, CA 12345"
-    address_patterns = [
-        r'(.+?),\s*([A-Za-z\s]+),\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)',
-        r'(.+?)\s+([A-Za-z\s]+),\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)',
-        r'(.+?)\s+([A-Z]{2})\s+(\d{5}(?:-\d{4})?)',  # Missing city
-    ]
-
-    for pattern in address_patterns:
-        match = re.search(pattern, text)
-        if match:
-            groups = match.groups()
-            if len(groups) == 4:
-                return (groups[0].strip(), groups[1].strip(), groups[2].strip(), groups[3].strip())
-            elif len(groups) == 3:
-                # Missing city case
-                return (groups[0].strip(), "", groups[1].strip(), groups[2].strip())
+    if _FIVE_DIGITS_RE.search(text):
+        for pattern in _ADDRESS_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                fields = match.groupdict()
+                return (
+                    fields['street'].strip(),
+                    fields.get('city', '').strip(),  # Missing city case
+                    fields['state'].strip(),
+                    fields['zip'].strip(),
+                )
 
     # Fallback: try to extract zip code
-    zip_match = re.search(r'\b(\d{5}(?:-\d{4})?)\b', text)
+    zip_match = _ZIP_RE.search(text)
     zip_code = zip_match.group(1) if zip_match else ""
 
     # Try to extract state (2-letter code)
-    state_match = re.search(r'\b([A-Z]{2})\b', text)
+    state_match = _STATE_RE.search(text)
     state = state_match.group(1) if state_match else ""
 
     return (text.strip(), "", state, zip_code)
@@ -134,13 +174,8 @@ def extract_website_url(text: str, links: Optional[List] = None,
                 continue
 
     # Try to extract URL from text using regex
-    url_patterns = [
-        r'https?://[^\s<>"\'\)]+',
-        r'www\.[^\s<>"\'\)]+',
-    ]
-
-    for pattern in url_patterns:
-        matches = re.findall(pattern, text)
+    for pattern in _URL_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             url = match if match.startswith('http') else f"https://{match}"
             if not any(skip in url.lower() for skip in skip_domains):
@@ -151,13 +186,15 @@ def extract_website_url(text: str, links: Optional[List] = None,
     return ""
 
 
-def clean_name(name: str, skip_patterns: Optional[List[str]] = None) -> Optional[str]:
+def clean_name(name: str,
+               skip_patterns: Optional[Union[List[str], Pattern]] = None) -> Optional[str]:
     """
     Clean and validate dealer name.
 
     Args:
         name: Raw dealer name
-        skip_patterns: Patterns to skip (e.g., ['view more', 'search'])
+        skip_patterns: Substrings to skip (e.g., ['view more', 'search']), or a
+            precompiled regex matched against the lowercased name
 
     Returns:
         Cleaned name or None if invalid
@@ -166,21 +203,30 @@ def clean_name(name: str, skip_patterns: Optional[List[str]] = None) -> Optional
         return None
 
     if skip_patterns is None:
-        skip_patterns = [
-            'search by', 'location', 'name', 'clear', 'advanced search',
-            'view map', 'make my dealer', 'chat with dealer', 'dealer website',
-            'find more', 'view more', 'load more', 'show more', 'see more',
-        ]
+        skip_patterns = _DEFAULT_SKIP_NAMES_RE
+    elif not isinstance(skip_patterns, (re.Pattern, tuple)):
+        skip_patterns = tuple(skip_patterns)  # Hashable for the cache
+
+    # Cards repeat across overlapping zip searches, so the same raw names
+    # come through many times per run
+    return _clean_name_cached(name, skip_patterns)
+
 
+@lru_cache(maxsize=8192)
+def _clean_name_cached(name: str, skip_patterns) -> Optional[str]:
+    """clean_name body, memoized on (name, skip patterns)."""
     name_lower = name.lower().strip()
 
     # Check against skip patterns
-    if any(pattern in name_lower for pattern in skip_patterns):
+    if isinstance(skip_patterns, re.Pattern):
+        if skip_patterns.search(name_lower):
+            return None
+    elif any(pattern in name_lower for pattern in skip_patterns):
         return None
 
     # Remove common prefixes/suffixes
-    name = re.sub(r'^\d+\.\s*', '', name)  # Remove "1. " prefix
-    name = re.sub(r'\s+', ' ', name)  # Normalize whitespace
+    name = _LIST_PREFIX_RE.sub('', name)  # Remove "1. " prefix
+    name = _WHITESPACE_RE.sub(' ', name)  # Normalize whitespace
     name = name.strip()
 
     if len(name) < 3:
@@ -199,14 +245,9 @@ def extract_distance(text: str) -> str:
     Returns:
         Distance string (e.g., "5.2") or empty string
     """
-    patterns = [
-        r'([\d.]+)\s*mi\b',
-        r'([\d.]+)\s*miles?\b',
-        r'([\d.]+)\s*mi\.',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text.lower())
+    text_lower = text.lower()
+    for pattern in _DISTANCE_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             return match.group(1)
 
@@ -7,9 +7,10 @@ Uses LLM to analyze discovered links and identify the best dealer locator page.
 
 import json
 import asyncio
+import re
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 from urllib.parse import urlparse
 from crawl4ai import AsyncWebCrawler
 from bs4 import BeautifulSoup
@@ -18,11 +19,19 @@ from bs4 import BeautifulSoup
 class DealerLocatorDiscovery:
     """Client for Crawl4AI-based URL discovery with LLM filtering."""
 
+    # Link filters, each matched in one pass per URL
+    DEALER_KEYWORDS_RE = re.compile(r'dealer|locate|find|directory|locator|store')
+    ASSET_PATH_RE = re.compile(r'/content/dam/|/assets/|/static/|/media/|/_next/')
+    SKIP_EXTENSIONS = (
+        '.jpg', '.jpeg', '.png', '.gif', '.pdf', '.svg', '.ico', '.webp', '.mp4', '.mp3', '.css', '.js', '.xml', '.json'
+    )
+
     def __init__(
         self,
         cache_dir: str = "data/discovery_cache",
         cache_ttl_days: int = 30,
-        max_depth: int = 2
+        max_depth: int = 2,
+        crawler_factory: Optional[Callable[[], Awaitable[AsyncWebCrawler]]] = None
     ):
         """
         Initialize discovery client using Crawl4AI.
@@ -31,11 +40,15 @@ class DealerLocatorDiscovery:
             cache_dir: Directory for caching discovery results
             cache_ttl_days: Cache TTL in days
             max_depth: Maximum crawl depth (1 = homepage only, 2 = homepage + 1 level)
+            crawler_factory: Async callable returning an already started crawler
+                to reuse (e.g. Crawl4AIScraper.get_crawler); without one, a
+                browser is launched for each crawl
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_ttl_days = cache_ttl_days
         self.max_depth = max_depth
+        self.crawler_factory = crawler_factory
 
     def _get_cache_path(self, domain: str) -> Path:
         """Get cache file path for a domain."""
@@ -84,41 +97,46 @@ class DealerLocatorDiscovery:
             Dictionary with 'urls' list or None if crawling fails
         """
         try:
-            async with AsyncWebCrawler(verbose=False) as crawler:
-                print(f"Crawling {url} for dealer locator links...")
+            print(f"Crawling {url} for dealer locator links...")
+            if self.crawler_factory is not None:
+                # Shared browser: only this crawl's page is opened and closed
+                crawler = await self.crawler_factory()
                 result = await crawler.arun(url=url)
-
-                if result.success and result.html:
-                    # Parse HTML to extract all links
-                    soup = BeautifulSoup(result.html, 'html.parser')
-                    links = []
-
-                    for a_tag in soup.find_all('a', href=True):
-                        href = a_tag['href']
-
-                        # Handle protocol-relative URLs (//example.com/path)
-                        if href.startswith('//'):
-                            parsed = urlparse(url)
-                            href = f"{parsed.scheme}:{href}"
-                        # Convert relative URLs to absolute
-                        elif href.startswith('/'):
-                            parsed = urlparse(url)
-                            href = f"{parsed.scheme}://{parsed.netloc}{href}"
-                        elif not href.startswith('http'):
-                            continue  # Skip non-HTTP links
-
-                        # Filter out anchors, mailto, tel, etc.
-                        if href.startswith(('http://', 'https://')):
-                            links.append(href)
-
-                    # Remove duplicates while preserving order
-                    unique_links = list(dict.fromkeys(links))
-
-                    print(f"Discovered {len(unique_links)} unique links from {url}")
-                    return {'urls': unique_links, 'success': True}
-                else:
-                    print(f"Crawl4AI failed to crawl {url}")
-                    return None
+            else:
+                async with AsyncWebCrawler(verbose=False) as crawler:
+                    result = await crawler.arun(url=url)
+
+            if result.success and result.html:
+                # Parse HTML to extract all links
+                soup = BeautifulSoup(result.html, 'html.parser')
+                links = []
+
+                for a_tag in soup.find_all('a', href=True):
+                    href = a_tag['href']
+
+                    # Handle protocol-relative URLs (//example.com/path)
+                    if href.startswith('//'):
+                        parsed = urlparse(url)
+                        href = f"{parsed.scheme}:{href}"
+                    # Convert relative URLs to absolute
+                    elif href.startswith('/'):
+                        parsed = urlparse(url)
+                        href = f"{parsed.scheme}://{parsed.netloc}{href}"
+                    elif not href.startswith('http'):
+                        continue  # Skip non-HTTP links
+
+                    # Filter out anchors, mailto, tel, etc.
+                    if href.startswith(('http://', 'https://')):
+                        links.append(href)
+
+                # Remove duplicates while preserving order
+                unique_links = list(dict.fromkeys(links))
+
+                print(f"Discovered {len(unique_links)} unique links from {url}")
+                return {'urls': unique_links, 'success': True}
+            else:
+                print(f"Crawl4AI failed to crawl {url}")
+                return None
 
         except Exception as e:
             print(f"Crawl4AI error: {e}")
@@ -140,26 +158,17 @@ class DealerLocatorDiscovery:
 
         llm = LLMAnalyzer()
 
-        # Filter URLs containing dealer-related keywords first
-        dealer_keywords = ['dealer', 'locate', 'find', 'directory', 'locator', 'store']
-
-        # Extensions to skip (images, documents, etc.)
-        skip_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.pdf', '.svg', '.ico', '.webp', '.mp4', '.mp3', '.css', '.js', '.xml', '.json']
-
+        # Keep URLs containing dealer-related keywords, skipping images,
+        # documents and asset paths
         filtered_urls = []
 
         for url in urls:
             url_lower = url.lower()
 
-            # Skip URLs with image/document extensions
-            if any(url_lower.endswith(ext) for ext in skip_extensions):
-                continue
-
-            # Skip URLs with image/asset paths
-            if any(path in url_lower for path in ['/content/dam/', '/assets/', '/static/', '/media/', '/_next/']):
+            if url_lower.endswith(self.SKIP_EXTENSIONS) or self.ASSET_PATH_RE.search(url_lower):
                 continue
 
-            if any(keyword in url_lower for keyword in dealer_keywords):
+            if self.DEALER_KEYWORDS_RE.search(url_lower):
                 filtered_urls.append(url)
 
         if not filtered_urls:
@@ -38,7 +38,7 @@ class JinaReader:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
-        # Track domains that have rate limited us
+        # Track domains that have rate limited us (time.monotonic() of the last 429)
         self._rate_limited_domains = {}
 
     def fetch_page_content(
@@ -72,7 +72,7 @@ class JinaReader:
         # Check if this domain was recently rate limited
         if domain in self._rate_limited_domains:
             last_limited = self._rate_limited_domains[domain]
-            if time.time() - last_limited < self.RATE_LIMIT_DELAY * 2:
+            if time.monotonic() - last_limited < self.RATE_LIMIT_DELAY * 2:
                 print(f"  Skipping {domain} - recently rate limited, waiting...")
                 time.sleep(self.RATE_LIMIT_DELAY)
 
@@ -112,7 +112,7 @@ class JinaReader:
                         
                         # Handle rate limiting (429)
                         if resp.status_code == 429:
-                            self._rate_limited_domains[domain] = time.time()
+                            self._rate_limited_domains[domain] = time.monotonic()
                             retry_after = int(resp.headers.get('Retry-After', self.RATE_LIMIT_DELAY))
                             print(f"  Rate limited (429) for {domain}, waiting {retry_after}s...")
                             time.sleep(retry_after)
@@ -156,7 +156,7 @@ class JinaReader:
                     
                     # Handle specific HTTP errors
                     if status_code == 429:
-                        self._rate_limited_domains[domain] = time.time()
+                        self._rate_limited_domains[domain] = time.monotonic()
                         retry_after = int(e.response.headers.get('Retry-After', self.RATE_LIMIT_DELAY))
                         print(f"  Rate limited (429) for {domain}, waiting {retry_after}s...")
                         time.sleep(retry_after)
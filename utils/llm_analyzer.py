@@ -20,8 +20,39 @@ class LLMAnalyzer:
     DEFAULT_ENDPOINT = "http://localhost:11434/api/generate"
     DEFAULT_MODEL = "gemma2:2b"  # Using Gemma2 2B (fast, no thinking mode)
     DEFAULT_TIMEOUT = 120  # Timeout for LLM analysis
+    DEFAULT_CONNECT_TIMEOUT = 5  # Timeout for reaching the endpoint at all
     DEFAULT_MAX_TOKENS = 1500  # Max tokens for LLM response
 
+    # Keyword lists matched as single precompiled alternations (one scan
+    # per string instead of one substring search per keyword)
+    LOCATOR_PHRASES = (
+        'find a dealer', 'dealer locator', 'locate a dealer',
+        'dealer directory', 'dealer search', 'find dealer',
+        'dealers', 'dealer'
+    )
+    NEGATIVE_KEYWORDS = (
+        'incentive', 'offer', 'build', 'price', 'compare', 'inventory',
+        'preowned', 'lease', 'apr', 'credit', 'quote', 'estimate', 'payment',
+        'test-drive', 'schedule'
+    )
+    POSITIVE_KEYWORDS = ('dealer', 'dealers', 'locator', 'location', 'directory', 'find')
+    LOCATOR_PATH_KEYWORDS = ('dealer', 'dealers', 'locator', 'locations')
+    _LOCATOR_PHRASES_RE = re.compile('|'.join(map(re.escape, LOCATOR_PHRASES)), re.IGNORECASE)
+    _NEGATIVE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, NEGATIVE_KEYWORDS)), re.IGNORECASE)
+    _POSITIVE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, POSITIVE_KEYWORDS)), re.IGNORECASE)
+    _LOCATOR_PATH_KEYWORDS_RE = re.compile('|'.join(map(re.escape, LOCATOR_PATH_KEYWORDS)))
+
+    # Locator path patterns and the score each adds when present
+    # ('/dealer-locator' counts double)
+    LOCATOR_PATH_SCORES = {
+        '/dealers': 2, '/dealer': 2, '/dealer-locator': 4, '/find-a-dealer': 2,
+        '/dealer-search': 2, '/dealer-directory': 2, '/locations': 2, '/locator': 2,
+    }
+    # All patterns in one pass: the longest one starting at each position
+    _LOCATOR_PATH_RE = re.compile(
+        '(?=(' + '|'.join(re.escape(p) for p in sorted(LOCATOR_PATH_SCORES, key=len, reverse=True)) + '))'
+    )
+
     def __init__(
         self,
         endpoint: Optional[str] = None,
@@ -40,7 +71,13 @@ class LLMAnalyzer:
         self.endpoint = endpoint or os.getenv('LLM_ENDPOINT', self.DEFAULT_ENDPOINT)
         self.model = model or os.getenv('LLM_MODEL', self.DEFAULT_MODEL)
         self.timeout = int(os.getenv('LLM_TIMEOUT', str(self.DEFAULT_TIMEOUT)))
+        self.connect_timeout = int(os.getenv('LLM_CONNECT_TIMEOUT', str(self.DEFAULT_CONNECT_TIMEOUT)))
+        # Set after a connection failure so later prompts in this run don't
+        # each wait on an endpoint that isn't there
+        self._unreachable = False
         self.max_tokens = int(os.getenv('LLM_MAX_TOKENS', str(self.DEFAULT_MAX_TOKENS)))
+        # Pooled keep-alive connections to the LLM endpoint across prompts
+        self.session = requests.Session()
 
     def analyze_page_structure(self, content: str, url: str) -> Optional[Dict[str, Any]]:
         """
@@ -143,28 +180,19 @@ class LLMAnalyzer:
         if not content:
             return []
 
-        keyword_phrases = [
-            'find a dealer', 'dealer locator', 'locate a dealer',
-            'dealer directory', 'dealer search', 'find dealer',
-            'dealers', 'dealer'
-        ]
-        keyword_phrases = [k.lower() for k in keyword_phrases]
-
+        has_phrase = self._LOCATOR_PHRASES_RE.search
         candidates = []
 
         # Match markdown links: [text](url)
         link_matches = re.findall(r'\[([^\]]+)\]\((https?://[^)]+|/[^)]+)\)', content)
         for text, url in link_matches:
-            text_lower = text.lower()
-            url_lower = url.lower()
-            if any(k in text_lower for k in keyword_phrases) or any(k in url_lower for k in keyword_phrases):
+            if has_phrase(text) or has_phrase(url):
                 candidates.append({'url': url, 'text': text, 'source': 'markdown'})
 
         # Match bare URLs that include dealer keywords
         bare_url_matches = re.findall(r'(https?://[^\s\)\]]+)', content)
         for url in bare_url_matches:
-            url_lower = url.lower()
-            if any(k in url_lower for k in keyword_phrases):
+            if has_phrase(url):
                 candidates.append({'url': url, 'text': '', 'source': 'bare'})
 
         return self._filter_locator_candidates(candidates)
@@ -191,13 +219,6 @@ class LLMAnalyzer:
         if not candidates:
             return []
 
-        negative_keywords = [
-            'incentive', 'offer', 'build', 'price', 'compare', 'inventory',
-            'preowned', 'lease', 'apr', 'credit', 'quote', 'estimate', 'payment',
-            'test-drive', 'schedule'
-        ]
-        positive_keywords = ['dealer', 'dealers', 'locator', 'location', 'directory', 'find']
-
         filtered = []
         seen = set()
         for candidate in candidates:
@@ -205,11 +226,9 @@ class LLMAnalyzer:
             if not url or url in seen or url.startswith('javascript:'):
                 continue
 
-            url_lower = url.lower()
-            text_lower = (candidate.get('text') or '').lower()
-            has_positive = any(k in url_lower for k in positive_keywords)
-
-            if any(k in url_lower or k in text_lower for k in negative_keywords) and not has_positive:
+            text = candidate.get('text') or ''
+            has_negative = self._NEGATIVE_KEYWORDS_RE.search(url) or self._NEGATIVE_KEYWORDS_RE.search(text)
+            if has_negative and not self._POSITIVE_KEYWORDS_RE.search(url):
                 continue
 
             seen.add(url)
@@ -243,15 +262,14 @@ class LLMAnalyzer:
             return 0
 
         url_lower = url.lower()
-        patterns = [
-            '/dealers', '/dealer', '/dealer-locator', '/find-a-dealer',
-            '/dealer-locator', '/dealer-search', '/dealer-directory',
-            '/locations', '/locator'
-        ]
-        score = 0
-        for pattern in patterns:
-            if pattern in url_lower:
-                score += 2
+        hits = set(self._LOCATOR_PATH_RE.findall(url_lower))
+        # The regex reports the longest pattern at each '/'; the shorter
+        # patterns it starts with are in the URL too
+        hits.update([
+            pattern for pattern in self.LOCATOR_PATH_SCORES
+            if any(hit.startswith(pattern) for hit in hits)
+        ])
+        score = sum(self.LOCATOR_PATH_SCORES[hit] for hit in hits)
         if '#default' in url_lower:
             score += 1
         return score
@@ -377,10 +395,9 @@ Return ONLY the JSON. /no_think"""
             # If LLM claims current page is locator, validate by checking URL path
             # and presence of dealer keywords in content
             url_path = urlparse(url).path.lower()
-            url_path_is_locator = any(
-                keyword in url_path for keyword in ['dealer', 'dealers', 'locator', 'locations']
-            )
-            content_has_locator_signal = 'zip' in relevant_content.lower() and 'dealer' in relevant_content.lower()
+            url_path_is_locator = bool(self._LOCATOR_PATH_KEYWORDS_RE.search(url_path))
+            content_lower = relevant_content.lower()
+            content_has_locator_signal = 'zip' in content_lower and 'dealer' in content_lower
 
             # If LLM says locator but URL path doesn't look like it, try fallback
             if is_locator and not url_path_is_locator and not content_has_locator_signal:
@@ -596,6 +613,9 @@ Return ONLY the JSON, no additional text or markdown formatting. /no_think"""
         Returns:
             LLM response text or None if failed
         """
+        if self._unreachable:
+            return None
+
         try:
             num_tokens = max_tokens if max_tokens is not None else self.max_tokens
             payload = {
@@ -608,10 +628,10 @@ Return ONLY the JSON, no additional text or markdown formatting. /no_think"""
                 }
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json=payload,
-                timeout=self.timeout
+                timeout=(self.connect_timeout, self.timeout)
             )
             response.raise_for_status()
 
@@ -619,8 +639,10 @@ Return ONLY the JSON, no additional text or markdown formatting. /no_think"""
             return result.get('response', '')
 
         except requests.exceptions.ConnectionError:
+            # Includes connect timeouts; read timeouts are handled below
             print(f"Error: Cannot connect to LLM at {self.endpoint}")
             print("Make sure Ollama is running: ollama serve")
+            self._unreachable = True
             return None
         except requests.exceptions.Timeout:
             print(f"Error: LLM request timed out after {self.timeout}s")
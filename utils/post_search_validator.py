@@ -14,8 +14,14 @@ from bs4 import BeautifulSoup
 class PostSearchValidator:
     """Validates search results and refines selectors based on actual HTML."""
 
-    def __init__(self):
-        """Initialize post-search validator."""
+    def __init__(self, debug: bool = False):
+        """
+        Initialize post-search validator.
+
+        Args:
+            debug: Log per-selector errors
+        """
+        self.debug = debug
         self.validation_cache = {}  # domain -> validation result
 
     def validate_search_results(
@@ -41,7 +47,7 @@ class PostSearchValidator:
             - suggested_selectors: Dict (if refinement needed)
             - dealer_count: int
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         # Check expected dealer card selectors
         expected_card_selectors = expected_config.get('selectors', {}).get('dealer_cards', [])
@@ -54,7 +60,8 @@ class PostSearchValidator:
                     cards_found.extend(cards)
                     break  # Found dealers with this selector
             except Exception as e:
-                print(f"Selector error: {selector} - {e}")
+                if self.debug:
+                    print(f"Selector error: {selector} - {e}")
                 continue
 
         dealers_found = len(cards_found) > 0
@@ -237,7 +244,7 @@ class PostSearchValidator:
         llm = LLMAnalyzer()
 
         # Truncate HTML for LLM
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         text_content = soup.get_text(separator='\n', strip=True)[:8000]
 
         # Extract sample HTML snippets for common dealer-related elements
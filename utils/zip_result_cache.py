@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Zip Result Cache
+
+Stores each zip code search's dealers on disk, keyed by (site URL, zip code,
+date), so re-running overlapping zip sets on the same day skips the browser
+work for zip codes that were already searched. Rows are positional, so each
+entry records the row schema it was written with and is ignored once that
+schema changes.
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+
+class ZipResultCache:
+    """SQLite-backed cache of per-zip search results."""
+
+    def __init__(self, schema: str, path: str = "data/zip_result_cache.db"):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            schema: Identifier of the row layout (e.g. the joined field
+                names); entries written with a different schema are misses
+            path: SQLite database file
+        """
+        self.schema = schema
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Site-worker processes may share the file; wait on their write locks
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(zip_results)")}
+        if columns and not {'site', 'schema'} <= columns:
+            # Written before rows were keyed by site URL and carried their
+            # schema; can't be trusted
+            self._conn.execute("DROP TABLE zip_results")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS zip_results ("
+            " site TEXT, zip_code TEXT, date TEXT, schema TEXT, rows TEXT,"
+            " PRIMARY KEY (site, zip_code, date))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now().strftime("%Y%m%d")
+
+    def get(self, site: str, zip_code: str) -> Optional[List[Tuple[str, ...]]]:
+        """
+        Load today's cached result for a zip code search.
+
+        Args:
+            site: Locator URL the search ran on (two locator pages on one
+                domain return different dealers)
+            zip_code: Searched zip code
+
+        Returns:
+            Dealer field-value rows (possibly empty), or None on a cache miss
+            (including entries written with another row schema)
+        """
+        row = self._conn.execute(
+            "SELECT rows FROM zip_results WHERE site = ? AND zip_code = ? AND date = ? AND schema = ?",
+            (site, zip_code, self._today(), self.schema)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return [tuple(values) for values in json.loads(row[0])]
+        except (TypeError, ValueError):
+            return None
+
+    def put(self, site: str, zip_code: str, rows: Sequence[Tuple[str, ...]]):
+        """
+        Save today's result for a zip code search.
+
+        Args:
+            site: Locator URL the search ran on
+            zip_code: Searched zip code
+            rows: Dealer field-value rows found for the zip code
+        """
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO zip_results (site, zip_code, date, schema, rows)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (site, zip_code, self._today(), self.schema, json.dumps(list(rows)))
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"  Warning: Failed to cache results for {zip_code}: {e}")
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()